@@ -12,6 +12,9 @@ from typing import Any
 MICRO_DOLLARS = 1_000_000  # 6 decimal places for subpenny precision
 JPY_PRECISION = 1_000  # 3 decimal places for JPY
 
+# Fixed-point scale per currency; anything not listed uses MICRO_DOLLARS
+CURRENCY_PRECISION = {"JPY": JPY_PRECISION}
+
 
 def currency_to_int(amount: Decimal, currency: str = "USD") -> int:
     """Convert Decimal to fixed-point integer (micro-dollars for USD).
@@ -26,13 +29,7 @@ def currency_to_int(amount: Decimal, currency: str = "USD") -> int:
     Note:
         Phase 1 supports USD only. Other currencies use USD precision.
     """
-    if currency in ["USD", "EUR", "GBP", "CAD", "AUD"]:
-        return int(amount * MICRO_DOLLARS)
-    elif currency == "JPY":
-        return int(amount * JPY_PRECISION)
-    else:
-        # Default to micro-dollars for unknown currencies
-        return int(amount * MICRO_DOLLARS)
+    return int(amount * CURRENCY_PRECISION.get(currency, MICRO_DOLLARS))
 
 
 def normalize_positions(
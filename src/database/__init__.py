@@ -49,6 +49,11 @@ def _sanitize_encryption_key(key: str) -> str:
     Raises:
         ValueError: If key contains invalid characters
     """
+    # Fast path for the common case: plain ASCII alphanumerics plus - and _.
+    # str.isalnum() alone would also accept non-ASCII letters, hence isascii().
+    if key.isascii() and key.replace("-", "").replace("_", "").isalnum():
+        return key
+
     # Validate key format - only alphanumeric, underscore, hyphen allowed
     if not re.match(r"^[a-zA-Z0-9_-]+$", key):
         raise ValueError(
@@ -60,6 +65,39 @@ def _sanitize_encryption_key(key: str) -> str:
     return key.replace("'", "''")
 
 
+# PRAGMAs that may be set through Database(pragmas=...). Names and values are
+# interpolated into the PRAGMA statement, so both are checked up front.
+ALLOWED_PRAGMAS = frozenset(
+    {"cache_size", "journal_mode", "locking_mode", "synchronous", "temp_store"}
+)
+
+
+def _validate_pragmas(pragmas: dict[str, str]) -> dict[str, str]:
+    """Validate extra PRAGMA name/value pairs to prevent SQL injection.
+
+    Args:
+        pragmas: PRAGMA name/value pairs to validate
+
+    Returns:
+        The pragmas, with values converted to str
+
+    Raises:
+        ValueError: If a name is not allowed or a value has invalid characters
+    """
+    validated = {}
+    for name, value in pragmas.items():
+        if name not in ALLOWED_PRAGMAS:
+            raise ValueError(f"PRAGMA {name!r} is not allowed")
+        value = str(value)
+        if not re.fullmatch(r"[A-Za-z0-9_-]+", value):
+            raise ValueError(
+                f"PRAGMA {name} value contains invalid characters. "
+                "Only alphanumeric, underscore, and hyphen allowed."
+            )
+        validated[name] = value
+    return validated
+
+
 class Database:
     """Database connection manager.
 
@@ -67,23 +105,40 @@ class Database:
     Models use this connection for their own persistence operations.
     """
 
-    def __init__(self, db_path: str, encryption_key: str | None = None):
+    def __init__(
+        self,
+        db_path: str,
+        encryption_key: str | None = None,
+        pragmas: dict[str, str] | None = None,
+        cached_statements: int | None = None,
+    ):
         """Initialize database connection.
 
         Args:
-            db_path: Path to database file
+            db_path: Path to database file, ":memory:", or a "file:" URI
+                (e.g. "file:name?mode=memory&cache=shared")
             encryption_key: Encryption key for SQLCipher (if enabled)
+            pragmas: Extra PRAGMA name/value pairs applied to every new
+                connection after the defaults (names from ALLOWED_PRAGMAS;
+                e.g. relaxed durability for throwaway test databases)
+            cached_statements: Size of sqlite3's per-connection prepared
+                statement cache (sqlite3 default when None)
 
         Raises:
             DatabaseConnectionError: If directory creation or initialization fails
+            ValueError: If pragmas contains a disallowed name or invalid value
         """
         self.db_path = db_path
         self.encryption_key = encryption_key
         self.encryption_enabled = encryption_key is not None and SQLCIPHER_AVAILABLE
+        self.pragmas = _validate_pragmas(pragmas or {})
+        self.cached_statements = cached_statements
+
+        self.uri = db_path.startswith("file:")
 
         # Ensure data directory exists
         try:
-            if db_path != ":memory:":
+            if db_path != ":memory:" and not self.uri:
                 Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         except OSError as e:
             logger.error(
@@ -106,17 +161,7 @@ class Database:
         Raises:
             DatabaseConnectionError: If connection fails
         """
-        try:
-            conn = self._connect()
-        except SQLiteError as e:
-            logger.error(f"Failed to connect to database: {e}", exc_info=True)
-            raise DatabaseConnectionError(f"Database connection failed: {e}") from e
-        except Exception as e:
-            # Catch all other exceptions (including mocked sqlite3.Error in tests)
-            logger.error(
-                f"Unexpected error during database connection: {e}", exc_info=True
-            )
-            raise DatabaseConnectionError(f"Unexpected database error: {e}") from e
+        conn = self._open()
 
         try:
             yield conn
@@ -141,6 +186,24 @@ class Database:
             except Exception as e:
                 logger.warning(f"Error closing database connection: {e}", exc_info=True)
 
+    def _open(self):
+        """Open a configured connection, wrapping failures.
+
+        Raises:
+            DatabaseConnectionError: If connection fails
+        """
+        try:
+            return self._connect()
+        except SQLiteError as e:
+            logger.error(f"Failed to connect to database: {e}", exc_info=True)
+            raise DatabaseConnectionError(f"Database connection failed: {e}") from e
+        except Exception as e:
+            # Catch all other exceptions (including mocked sqlite3.Error in tests)
+            logger.error(
+                f"Unexpected error during database connection: {e}", exc_info=True
+            )
+            raise DatabaseConnectionError(f"Unexpected database error: {e}") from e
+
     def _connect(self):
         """Create and configure database connection.
 
@@ -161,6 +224,12 @@ class Database:
             # Validate key format and sanitize before attempting connection
             sanitized_key = _sanitize_encryption_key(self.encryption_key)
 
+        connect_options = {}
+        if self.uri:
+            connect_options["uri"] = True
+        if self.cached_statements is not None:
+            connect_options["cached_statements"] = self.cached_statements
+
         try:
             conn = sqlite3.connect(
                 self.db_path,
@@ -170,6 +239,7 @@ class Database:
                 # - Read-only operations don't need complex transactions
                 # - Each statement executes atomically
                 # - Simpler model for single-user, local-first application
+                **connect_options,
             )
         except SQLiteError as e:
             logger.error(
@@ -188,6 +258,9 @@ class Database:
 
             # Enable foreign keys
             conn.execute("PRAGMA foreign_keys=ON")
+
+            for name, value in self.pragmas.items():
+                conn.execute(f"PRAGMA {name}={value}")
         except SQLiteError as e:
             conn.close()
             logger.error(f"Failed to configure database PRAGMAs: {e}", exc_info=True)
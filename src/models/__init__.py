@@ -5,8 +5,19 @@ Models provide object-relational mapping with ActiveRecord pattern.
 
 # Re-export Model base class for convenient imports
 from src.models.account import Account
-from src.models.active_model import ActiveModel, ActiveModelError
+from src.models.active_model import (
+    ActiveModel,
+    ActiveModelError,
+    MissingPrimaryKeyError,
+)
 from src.models.position import Position
 from src.models.symbol import Symbol
 
-__all__ = ["ActiveModel", "ActiveModelError", "Account", "Position", "Symbol"]
+__all__ = [
+    "ActiveModel",
+    "ActiveModelError",
+    "MissingPrimaryKeyError",
+    "Account",
+    "Position",
+    "Symbol",
+]
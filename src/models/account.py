@@ -19,16 +19,11 @@ class Account(ActiveModel):
     primary_key = "id"
     primary_key_type = "TEXT"
 
-    _allowed_fields = {
-        "id",
-        "name",
-        "base_currency",
-        "created_at",
-        "updated_at",
-    }
+    columns = ("id", "name", "base_currency", "created_at", "updated_at")
+    _allowed_fields = frozenset(columns)
 
     def __init__(self, database: Database, **kwargs):
-        invalid_fields = set(kwargs.keys()) - self._allowed_fields
+        invalid_fields = kwargs.keys() - self._allowed_fields
 
         if invalid_fields:
             raise ValueError(f"Invalid fields: {invalid_fields}")
@@ -54,12 +49,13 @@ class Account(ActiveModel):
         if not self.id:
             errors.append("ID is required for Account")
 
-        current_fields = set(self._get_attributes().keys())
-        invalid_fields = current_fields - self._allowed_fields
+        invalid_fields = self._invalid_fields()
         if invalid_fields:
             errors.append(
                 f"Invalid fields detected before save: {sorted(invalid_fields)}"
             )
 
         if errors:
-            raise ActiveModelError(f"Validation failed: {', '.join(errors)}")
+            raise ActiveModelError(
+                f"Validation failed: {', '.join(errors)}", errors=errors
+            )
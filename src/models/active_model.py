@@ -1,8 +1,8 @@
 """ActiveRecord-style base Model class.
 
 Provides object-relational mapping with ActiveRecord pattern:
-- Instance methods for persistence (save, delete)
-- Class methods for queries (find_by_id, find_by, where, all)
+- Instance methods for persistence (save, delete, reload)
+- Class methods for queries (find_by_id, find_by, where, pluck, all)
 """
 
 from datetime import datetime
@@ -12,15 +12,54 @@ from src.database import Database, SQLiteError
 
 
 class ActiveModelError(Exception):
-    """Base exception for model errors."""
+    """Base exception for model errors.
 
-    pass
+    Attributes:
+        errors: Individual validation messages, when raised by validate()
+    """
+
+    def __init__(self, message: str = "", errors: list[str] | None = None):
+        super().__init__(message)
+        self.errors = list(errors) if errors else []
 
 
 # Alias for consistency with ActiveModel naming
 ActiveModelError = ActiveModelError
 
 
+class MissingPrimaryKeyError(ValueError):
+    """Raised when an operation needs a primary key value that is not set."""
+
+    pass
+
+
+def _find_by_id_sql(
+    table_name: str, primary_key: str, columns: tuple[str, ...] = ()
+) -> str:
+    """Build the primary-key lookup query."""
+    projection = ", ".join(columns) if columns else "*"
+    return f"SELECT {projection} FROM {table_name} WHERE {primary_key} = ?"
+
+
+def _insert_sql(table_name: str, columns: tuple[str, ...]) -> str:
+    """Build an INSERT query for the given columns."""
+    placeholders = ", ".join("?" * len(columns))
+    return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+def _update_sql(table_name: str, primary_key: str, columns: tuple[str, ...]) -> str:
+    """Build an UPDATE-by-primary-key query for the given columns."""
+    set_clauses = ", ".join(f"{col} = ?" for col in columns)
+    return f"UPDATE {table_name} SET {set_clauses} WHERE {primary_key} = ?"
+
+
+def _where_clause(conditions: dict[str, Any]) -> str:
+    """Build the " WHERE col = ? AND ..." suffix for conditions ("" if none)."""
+    if not conditions:
+        return ""
+    return " WHERE " + " AND ".join(f"{col} = ?" for col in conditions)
+
+
 class ActiveModel:
     """Base class for ActiveRecord-style models.
 
@@ -28,11 +67,19 @@ class ActiveModel:
     - table_name: Name of the database table
     - primary_key: Name of the primary key column
     - primary_key_type: Type of primary key ("TEXT" or "INTEGER")
+
+    Subclasses may define:
+    - columns: Explicit column list for find_by_id (defaults to SELECT *) and
+      for _get_attributes (defaults to every public instance attribute)
+    - _allowed_fields: Valid attribute names for _invalid_fields (defaults to
+      columns)
     """
 
     table_name: str
     primary_key: str
     primary_key_type: str  # "TEXT" or "INTEGER"
+    columns: tuple[str, ...] = ()
+    _allowed_fields: frozenset[str] = frozenset()
 
     def __init__(self, database: Database, **kwargs):
         """Initialize model instance.
@@ -72,15 +119,38 @@ class ActiveModel:
     def _get_attributes(self) -> dict[str, Any]:
         """Get all non-private attributes for database operations.
 
+        When the class declares columns, only those columns are read, which
+        skips scanning __dict__ and the "_" prefix check on every save.
+
         Returns:
             Dictionary of column names and values (excluding _database)
         """
+        if self.columns:
+            values = self.__dict__
+            return {name: values[name] for name in self.columns if name in values}
+
         attrs = {}
         for key, value in self.__dict__.items():
             if not key.startswith("_"):
                 attrs[key] = value
         return attrs
 
+    def _invalid_fields(self) -> set[str]:
+        """Get public instance attributes that are not in _allowed_fields.
+
+        _get_attributes() only reads declared columns, so validate() uses this
+        to catch unknown attributes set after __init__.
+
+        Returns:
+            Set of invalid attribute names (empty when all are allowed, or
+            when the class declares neither _allowed_fields nor columns)
+        """
+        allowed = self._allowed_fields or frozenset(self.columns)
+        if not allowed:
+            return set()
+        public_fields = {key for key in vars(self) if not key.startswith("_")}
+        return public_fields - allowed
+
     def _before_save(self) -> None:
         """Hook called before save operation.
 
@@ -121,7 +191,7 @@ class ActiveModel:
             else:
                 # TEXT primary key must be provided
                 if self.primary_key not in attrs or attrs.get(self.primary_key) is None:
-                    raise ValueError(
+                    raise MissingPrimaryKeyError(
                         f"{self.primary_key} is required for new "
                         f"{self.__class__.__name__} record"
                     )
@@ -130,11 +200,7 @@ class ActiveModel:
             self.updated_at = datetime.utcnow().isoformat()
             attrs["updated_at"] = self.updated_at
 
-            # Build INSERT query
-            columns = ", ".join(attrs.keys())
-            placeholders = ", ".join("?" * len(attrs))
-            query = f"INSERT INTO {self.table_name} ({columns}) VALUES ({placeholders})"
-
+            query = _insert_sql(self.table_name, tuple(attrs))
             cursor.execute(query, list(attrs.values()))
 
             # Get auto-generated ID if INTEGER PRIMARY KEY
@@ -153,11 +219,7 @@ class ActiveModel:
             if not update_cols:
                 raise ValueError("No fields to update")
 
-            set_clauses = ", ".join(f"{col} = ?" for col in update_cols)
-            query = (
-                f"UPDATE {self.table_name} SET {set_clauses} "
-                f"WHERE {self.primary_key} = ?"
-            )
+            query = _update_sql(self.table_name, self.primary_key, tuple(update_cols))
 
             # Prepare values: all attributes except primary key, then primary key value
             values = [attrs[col] for col in update_cols]
@@ -230,12 +292,12 @@ class ActiveModel:
             True on success
 
         Raises:
-            ValueError: If primary key is not set
+            MissingPrimaryKeyError: If primary key is not set
             SQLiteError: If database operation fails
         """
         pk_value = getattr(self, self.primary_key, None)
         if pk_value is None:
-            raise ValueError(
+            raise MissingPrimaryKeyError(
                 f"Cannot delete {self.__class__.__name__} without {self.primary_key}"
             )
 
@@ -249,6 +311,108 @@ class ActiveModel:
         except SQLiteError:
             raise
 
+    def reload(self) -> "ActiveModel":
+        """Refresh attributes from the stored row with this primary key.
+
+        Returns:
+            self, updated in place
+
+        Raises:
+            MissingPrimaryKeyError: If primary key is not set
+            ActiveModelError: If the row no longer exists
+            SQLiteError: If database operation fails
+        """
+        pk_value = getattr(self, self.primary_key, None)
+        if pk_value is None:
+            raise MissingPrimaryKeyError(
+                f"Cannot reload {self.__class__.__name__} without {self.primary_key}"
+            )
+
+        try:
+            with self._database.connection() as conn:
+                cursor = conn.cursor()
+                query = _find_by_id_sql(self.table_name, self.primary_key, self.columns)
+                cursor.execute(query, (pk_value,))
+                row = cursor.fetchone()
+                columns = [desc[0] for desc in cursor.description]
+
+        except SQLiteError:
+            raise
+
+        if row is None:
+            raise ActiveModelError(
+                f"{self.__class__.__name__} {pk_value} no longer exists"
+            )
+
+        self.__dict__.update(zip(columns, row))
+        return self
+
+    @classmethod
+    def bulk_save(cls, database: Database, instances: list["ActiveModel"]) -> int:
+        """Insert many new records with one executemany in one transaction.
+
+        Runs _before_save() on every instance first, so validation still
+        applies. Unlike save(), this only inserts, skips _save_to_database()
+        and _after_save(), and does not set auto-generated INTEGER ids on
+        the instances.
+
+        Args:
+            database: Database instance
+            instances: New model instances, all with the same columns
+
+        Returns:
+            Number of records inserted
+
+        Raises:
+            ModelError: If validation fails (from _before_save)
+            MissingPrimaryKeyError: If a TEXT primary key is missing
+            ValueError: If an INTEGER primary key is already set (the instance
+                is already saved) or the instances' columns differ
+            SQLiteError: If database operation fails (no rows are kept)
+        """
+        if not instances:
+            return 0
+
+        now = datetime.utcnow().isoformat()
+        columns: tuple[str, ...] = ()
+        rows = []
+        for instance in instances:
+            if (
+                cls.primary_key_type == "INTEGER"
+                and getattr(instance, cls.primary_key, None) is not None
+            ):
+                raise ValueError(
+                    f"bulk_save only inserts new records; {cls.__name__} "
+                    f"{cls.primary_key}={getattr(instance, cls.primary_key)!r} "
+                    "is already saved"
+                )
+            instance._before_save()
+            instance.updated_at = now
+
+            attrs = instance._get_attributes()
+            if cls.primary_key_type == "INTEGER":
+                attrs.pop(cls.primary_key, None)
+            elif attrs.get(cls.primary_key) is None:
+                raise MissingPrimaryKeyError(
+                    f"{cls.primary_key} is required for new {cls.__name__} record"
+                )
+
+            if not columns:
+                columns = tuple(attrs)
+            elif tuple(attrs) != columns:
+                raise ValueError(
+                    f"bulk_save requires every {cls.__name__} to have the same columns"
+                )
+            rows.append(tuple(attrs.values()))
+
+        with database.connection() as conn:
+            # Autocommit would otherwise commit each row on its own
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            conn.cursor().executemany(_insert_sql(cls.table_name, columns), rows)
+
+        return len(rows)
+
     @classmethod
     def find_by_id(cls, database: Database, pk_value: Any) -> Optional["ActiveModel"]:
         """Find record by primary key.
@@ -263,7 +427,7 @@ class ActiveModel:
         try:
             with database.connection() as conn:
                 cursor = conn.cursor()
-                query = f"SELECT * FROM {cls.table_name} WHERE {cls.primary_key} = ?"
+                query = _find_by_id_sql(cls.table_name, cls.primary_key, cls.columns)
                 cursor.execute(query, (pk_value,))
                 row = cursor.fetchone()
 
@@ -311,13 +475,7 @@ class ActiveModel:
             with database.connection() as conn:
                 cursor = conn.cursor()
 
-                if kwargs:
-                    # Build WHERE clause
-                    where_clauses = " AND ".join(f"{col} = ?" for col in kwargs.keys())
-                    query = f"SELECT * FROM {cls.table_name} WHERE {where_clauses}"
-                else:
-                    query = f"SELECT * FROM {cls.table_name}"
-
+                query = f"SELECT * FROM {cls.table_name}{_where_clause(kwargs)}"
                 if limit:
                     query += f" LIMIT {limit}"
 
@@ -339,6 +497,51 @@ class ActiveModel:
         except SQLiteError:
             raise
 
+    @classmethod
+    def pluck(cls, database: Database, column: str, **kwargs) -> list[Any]:
+        """Get one column's values from matching records without building models.
+
+        Args:
+            database: Database instance
+            column: Name of the column to return
+            **kwargs: Column name and value pairs to match
+
+        Returns:
+            List of column values, in table order
+        """
+        query = f"SELECT {column} FROM {cls.table_name}{_where_clause(kwargs)}"
+
+        try:
+            with database.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, list(kwargs.values()))
+                return [row[0] for row in cursor.fetchall()]
+
+        except SQLiteError:
+            raise
+
+    @classmethod
+    def count(cls, database: Database, **kwargs) -> int:
+        """Count matching records without fetching or building them.
+
+        Args:
+            database: Database instance
+            **kwargs: Column name and value pairs to match
+
+        Returns:
+            Number of matching records
+        """
+        query = f"SELECT COUNT(*) FROM {cls.table_name}{_where_clause(kwargs)}"
+
+        try:
+            with database.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, list(kwargs.values()))
+                return int(cursor.fetchone()[0])
+
+        except SQLiteError:
+            raise
+
     @classmethod
     def all(cls, database: Database) -> list["ActiveModel"]:
         """Get all records from table.
@@ -34,7 +34,7 @@ class Position(ActiveModel):
     primary_key = "id"
     primary_key_type = "INTEGER"
 
-    _allowed_fields = {
+    columns = (
         "id",
         "account_id",
         "symbol_id",
@@ -48,7 +48,8 @@ class Position(ActiveModel):
         "snapshot_ts",
         "created_at",
         "updated_at",
-    }
+    )
+    _allowed_fields = frozenset(columns)
 
     def __init__(self, database: Database, **kwargs):
         """Initialize Position instance.
@@ -61,7 +62,7 @@ class Position(ActiveModel):
             For INTEGER PRIMARY KEY, 'id' should not be provided for new records.
             It will be auto-generated by the database.
         """
-        invalid_fields = set(kwargs.keys()) - self._allowed_fields
+        invalid_fields = kwargs.keys() - self._allowed_fields
 
         if invalid_fields:
             raise ValueError(f"Invalid fields: {invalid_fields}")
@@ -134,15 +135,10 @@ class Position(ActiveModel):
         # Validate snapshot_ts is valid ISO-8601 format
         if hasattr(self, "snapshot_ts") and self.snapshot_ts:
             try:
-                # Handle Z timezone suffix (Python 3.11+ supports it directly,
-                # but we normalize for compatibility)
-                ts_str = (
-                    self.snapshot_ts.replace("Z", "+00:00")
-                    if "Z" in self.snapshot_ts
-                    else self.snapshot_ts
-                )
-                datetime.fromisoformat(ts_str)
-            except (ValueError, AttributeError):
+                # The project is Python 3.11-only, where fromisoformat() (C-coded)
+                # accepts the "Z" suffix directly - no normalization needed
+                datetime.fromisoformat(self.snapshot_ts)
+            except (ValueError, TypeError):
                 errors.append(
                     f"snapshot_ts must be valid ISO-8601 format, got {self.snapshot_ts}"
                 )
@@ -163,16 +159,16 @@ class Position(ActiveModel):
                         f"got {type(getattr(self, field)).__name__}"
                     )
 
-        # Check for invalid fields
-        current_fields = set(self._get_attributes().keys())
-        invalid_fields = current_fields - self._allowed_fields
+        invalid_fields = self._invalid_fields()
         if invalid_fields:
             errors.append(
                 f"Invalid fields detected before save: {sorted(invalid_fields)}"
             )
 
         if errors:
-            raise ActiveModelError(f"Validation failed: {', '.join(errors)}")
+            raise ActiveModelError(
+                f"Validation failed: {', '.join(errors)}", errors=errors
+            )
 
     @classmethod
     def create_from_api_data(
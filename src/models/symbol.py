@@ -30,7 +30,7 @@ class Symbol(ActiveModel):
     primary_key = "id"
     primary_key_type = "INTEGER"
 
-    _allowed_fields = {
+    columns = (
         "id",
         "conid",
         "symbol",
@@ -47,23 +47,26 @@ class Symbol(ActiveModel):
         "primary_exchange",
         "created_at",
         "updated_at",
-    }
-
-    # Valid security types
-    VALID_SEC_TYPES = {
-        "STK",  # Stock
-        "OPT",  # Option
-        "FUT",  # Future
-        "CASH",  # Cash/FX
-        "BOND",  # Bond
-        "CFD",  # Contract for Difference
-        "FOP",  # Future Option
-        "WAR",  # Warrant
-        "IOPT",  # Index Option
-    }
+    )
+    _allowed_fields = frozenset(columns)
+
+    # Valid security types (frozen: shared by every instance, never mutated)
+    VALID_SEC_TYPES = frozenset(
+        {
+            "STK",  # Stock
+            "OPT",  # Option
+            "FUT",  # Future
+            "CASH",  # Cash/FX
+            "BOND",  # Bond
+            "CFD",  # Contract for Difference
+            "FOP",  # Future Option
+            "WAR",  # Warrant
+            "IOPT",  # Index Option
+        }
+    )
 
     # Valid option rights
-    VALID_RIGHTS = {"C", "P"}
+    VALID_RIGHTS = frozenset({"C", "P"})
 
     def __init__(self, database: Database, **kwargs):
         """Initialize Symbol instance.
@@ -76,7 +79,7 @@ class Symbol(ActiveModel):
             For INTEGER PRIMARY KEY, 'id' should not be provided for new records.
             It will be auto-generated by the database.
         """
-        invalid_fields = set(kwargs.keys()) - self._allowed_fields
+        invalid_fields = kwargs.keys() - self._allowed_fields
 
         if invalid_fields:
             raise ValueError(f"Invalid fields: {invalid_fields}")
@@ -141,16 +144,16 @@ class Symbol(ActiveModel):
             if not isinstance(self.underlying_conid, int):
                 errors.append("underlying_conid must be an integer")
 
-        # Check for invalid fields
-        current_fields = set(self._get_attributes().keys())
-        invalid_fields = current_fields - self._allowed_fields
+        invalid_fields = self._invalid_fields()
         if invalid_fields:
             errors.append(
                 f"Invalid fields detected before save: {sorted(invalid_fields)}"
             )
 
         if errors:
-            raise ActiveModelError(f"Validation failed: {', '.join(errors)}")
+            raise ActiveModelError(
+                f"Validation failed: {', '.join(errors)}", errors=errors
+            )
 
     @classmethod
     def find_by_conid(cls, database: Database, conid: int) -> "Symbol | None":
@@ -2,12 +2,12 @@
 
 import os
 import tempfile
-from datetime import datetime
 
 import pytest
 from alembic.config import Config
 
 from alembic import command
+from tests.fixtures import FIXED_NOW
 
 
 @pytest.fixture(scope="function")
@@ -20,24 +20,54 @@ def temp_db_path():
         os.remove(db_path)
 
 
-@pytest.fixture(scope="function")
-def test_db_schema(temp_db_path):
-    """Create test database schema using Alembic migration."""
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option(
-        "sqlalchemy.url", f"sqlite:///{os.path.abspath(temp_db_path)}"
-    )
-    command.upgrade(alembic_config, "head")
-    yield temp_db_path
+@pytest.fixture(autouse=True)
+def _no_retry_sleep(monkeypatch):
+    """Skip the API client's exponential backoff waits in every test.
 
+    Retries still happen (tests assert on attempt counts); only the
+    tenacity sleep between attempts becomes a no-op.
+    """
+    from src.api_client import IBKRAPIClient
+
+    monkeypatch.setattr(IBKRAPIClient._get.retry, "sleep", lambda seconds: None)
+
+
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory):
+    """Alembic-migrated database file, built once per session (and xdist worker)."""
+    template_path = tmp_path_factory.mktemp("schema") / "template.db"
+    with pytest.MonkeyPatch.context() as mp:
+        # alembic/env.py takes the database from DB_PATH, overriding sqlalchemy.url
+        mp.setenv("DB_PATH", str(template_path))
+        alembic_config = Config("alembic.ini")
+        alembic_config.set_main_option("sqlalchemy.url", f"sqlite:///{template_path}")
+        command.upgrade(alembic_config, "head")
+    return template_path
 
-@pytest.fixture(scope="function")
-def test_db(test_db_schema):
-    """Create a Database instance for testing."""
-    from src.database import Database
 
-    db = Database(db_path=test_db_schema, encryption_key=None)
-    return db
+@pytest.fixture(scope="session")
+def memory_db():
+    """Session-wide in-memory PersistentDatabase (one shared connection).
+
+    There is no root ``test_db``: test packages define one that returns this
+    instance (after creating their schema) and request ``db_savepoint`` for
+    isolation.
+    """
+    from tests.fixtures.database import PersistentDatabase
+
+    db = PersistentDatabase(db_path="file:quantfi_test?mode=memory&cache=shared")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def db_savepoint(test_db):
+    """Roll back everything a test writes to a persistent ``test_db``."""
+    with test_db.connection() as conn:
+        conn.execute("SAVEPOINT test_sp")
+        yield
+        conn.execute("ROLLBACK TO SAVEPOINT test_sp")
+        conn.execute("RELEASE SAVEPOINT test_sp")
 
 
 @pytest.fixture
@@ -78,7 +108,7 @@ def sample_execution():
         "commission_amount": 100,  # $0.0001 in micro-dollars
         "commission_currency": "USD",
         "executed_at": "2025-01-15T14:30:00Z",
-        "ingested_at": datetime.utcnow().isoformat() + "Z",
+        "ingested_at": FIXED_NOW,
     }
 
 
@@ -93,5 +123,5 @@ def sample_position():
         "market_value": 15025123400,  # $15,025.123400 in micro-dollars
         "avg_cost": 149500000,  # $149.50 in micro-dollars
         "currency": "USD",
-        "snapshot_ts": datetime.utcnow().isoformat() + "Z",
+        "snapshot_ts": FIXED_NOW,
     }
@@ -1,2 +1,4 @@
 """Test fixtures and mock data."""
 
+# Fixed timestamp for seeded and sample rows; nothing compares it to the clock
+FIXED_NOW = "2025-01-15T14:35:00Z"
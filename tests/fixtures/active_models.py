@@ -0,0 +1,148 @@
+"""Shared ActiveModel test models and schema.
+
+Used by the tests under tests/unit/models/active_model/.
+"""
+
+from src.models.active_model import ActiveModel, ActiveModelError
+from tests.fixtures import FIXED_NOW
+
+SCHEMA_SQL = """
+    CREATE TABLE accounts (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        base_currency TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    CREATE TABLE positions (
+        id INTEGER PRIMARY KEY,
+        quantity REAL NOT NULL,
+        currency TEXT NOT NULL,
+        computed_field TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+"""
+
+# Test-controlled literals only; never build statements like this from input
+SEED_POSITION_SQL = (
+    "INSERT INTO positions (id, quantity, currency, created_at, updated_at) "
+    f"VALUES (1, 100.0, 'USD', '{FIXED_NOW}', '{FIXED_NOW}')"
+)
+
+# (id, name, base_currency) row sets for the seeded_accounts fixture
+ACCOUNTS_USD_EUR = [("U1", "Account 1", "USD"), ("U2", "Account 2", "EUR")]
+ACCOUNTS_USD_USD_EUR = [
+    ("U1", "Account 1", "USD"),
+    ("U2", "Account 2", "USD"),
+    ("U3", "Account 3", "EUR"),
+]
+
+
+class AccountTestActiveModel(ActiveModel):
+    """Test ActiveModel class using TEXT primary key (like Account)."""
+
+    table_name = "accounts"
+    primary_key = "id"
+    primary_key_type = "TEXT"
+
+
+class PositionTestActiveModel(ActiveModel):
+    """Test ActiveModel class using INTEGER primary key (like Position)."""
+
+    table_name = "positions"
+    primary_key = "id"
+    primary_key_type = "INTEGER"
+
+    @classmethod
+    def raw(cls, database, **fields):
+        """Build an instance without __init__'s timestamp defaults.
+
+        For negative-path tests that never save, so the timestamps would
+        only be thrown away.
+        """
+        instance = cls.__new__(cls)
+        instance.__dict__.update(fields, _database=database)
+        return instance
+
+
+# Hook test models record into this list; the hook_calls fixture clears it
+HOOK_CALLS = []
+
+
+class RecordingHooksModel(PositionTestActiveModel):
+    """Records each save hook as it runs."""
+
+    def _before_save(self):
+        HOOK_CALLS.append("before")
+
+    def _save_to_database(self, conn, attrs, is_new):
+        HOOK_CALLS.append("save")
+        super()._save_to_database(conn, attrs, is_new)
+
+    def _after_save(self):
+        HOOK_CALLS.append("after")
+
+
+class RejectingHooksModel(RecordingHooksModel):
+    """Fails validation in _before_save."""
+
+    def _before_save(self):
+        HOOK_CALLS.append("before")
+        raise ActiveModelError("Validation failed")
+
+
+class UppercaseCurrencyModel(PositionTestActiveModel):
+    """Normalizes currency in _before_save."""
+
+    def _before_save(self):
+        currency = getattr(self, "currency", None)
+        if currency is not None:
+            self.currency = currency.upper()
+
+
+class SavedIdRecordingModel(PositionTestActiveModel):
+    """Records the id visible to _after_save."""
+
+    def _after_save(self):
+        HOOK_CALLS.append(getattr(self, "id", None))
+
+
+class ComputedFieldModel(PositionTestActiveModel):
+    """Replaces _save_to_database with a custom INSERT."""
+
+    def _save_to_database(self, conn, attrs, is_new):
+        HOOK_CALLS.append("custom_save")
+
+        # Custom save logic: insert with extra computed field
+        cursor = conn.cursor()
+        attrs.pop(self.primary_key, None)  # Remove id for INSERT
+        attrs["computed_field"] = "computed_value"
+        attrs["updated_at"] = FIXED_NOW
+
+        columns = ", ".join(attrs.keys())
+        placeholders = ", ".join("?" * len(attrs))
+        query = f"INSERT INTO {self.table_name} ({columns}) VALUES ({placeholders})"
+        cursor.execute(query, list(attrs.values()))
+
+        # Set auto-generated ID
+        setattr(self, self.primary_key, cursor.lastrowid)
+
+
+class IsNewRecordingModel(PositionTestActiveModel):
+    """Records the is_new flag passed to _save_to_database."""
+
+    def _save_to_database(self, conn, attrs, is_new):
+        HOOK_CALLS.append(is_new)
+        super()._save_to_database(conn, attrs, is_new)
+
+
+class BrokenSaveModel(PositionTestActiveModel):
+    """Fails inside _save_to_database."""
+
+    def _save_to_database(self, conn, attrs, is_new):
+        # Force a database error
+        conn.cursor().execute("INVALID SQL SYNTAX")
+
+    def _after_save(self):
+        HOOK_CALLS.append("after")
@@ -0,0 +1,19 @@
+"""Deterministic clock for tests that patch a module's datetime."""
+
+from datetime import datetime, timedelta
+
+
+class TickingClock:
+    """Stand-in for the datetime class whose utcnow() advances each call.
+
+    Monkeypatch it over a module's datetime (e.g.
+    src.models.active_model.datetime) to get strictly increasing timestamps
+    without sleeping.
+    """
+
+    def __init__(self, start=datetime(2024, 1, 1)):
+        self._now = start
+
+    def utcnow(self):
+        self._now += timedelta(seconds=1)
+        return self._now
@@ -0,0 +1,87 @@
+"""Test-only Database variants.
+
+PersistentDatabase keeps one connection open so tests can share a database
+(e.g. a named in-memory one) and roll back per-test writes with db_savepoint.
+"""
+
+import logging
+from contextlib import contextmanager
+
+from src.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Throwaway test databases need no durability: keep the journal and temp
+# tables in memory and never fsync.
+TEST_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-20000",
+}
+
+
+class PersistentDatabase(Database):
+    """Database that reuses a single connection for its whole lifetime.
+
+    Each connection() block runs inside a SAVEPOINT on that connection, so
+    blocks can nest inside an outer transaction and roll back with it.
+    Releasing a savepoint that is not nested commits it, so top-level
+    callers see the same behaviour as Database.connection().
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        encryption_key: str | None = None,
+        pragmas: dict[str, str] | None = None,
+        cached_statements: int | None = 256,
+    ):
+        """Initialize the database; the connection opens on first use.
+
+        Args:
+            db_path: Path to database file, ":memory:", or a "file:" URI
+            encryption_key: Encryption key for SQLCipher (if enabled)
+            pragmas: Extra PRAGMAs (TEST_PRAGMAS plus an EXCLUSIVE lock, which
+                the one connection never contends for, when None)
+            cached_statements: Size of the connection's prepared statement
+                cache (the shared connection runs every test's queries)
+        """
+        if pragmas is None:
+            pragmas = {**TEST_PRAGMAS, "locking_mode": "EXCLUSIVE"}
+        super().__init__(db_path, encryption_key, pragmas, cached_statements)
+        self._conn = None
+
+    @contextmanager
+    def connection(self):
+        """Yield the shared connection inside a SAVEPOINT.
+
+        Raises:
+            DatabaseConnectionError: If the first connection attempt fails
+        """
+        if self._conn is None:
+            self._conn = self._open()
+        conn = self._conn
+
+        # The caller may end the transaction itself (conn.commit(), or the
+        # implicit COMMIT issued by executescript()), which also discards the
+        # savepoint - only release/roll back while a transaction is open.
+        conn.execute("SAVEPOINT db_connection")
+        try:
+            yield conn
+        except BaseException as e:
+            # BaseException too: an interrupt, pytest.fail()/skip() or
+            # GeneratorExit must not leave the savepoint (and its writes) open
+            if conn.in_transaction:
+                conn.execute("ROLLBACK TO SAVEPOINT db_connection")
+                conn.execute("RELEASE SAVEPOINT db_connection")
+            logger.error(f"Database savepoint rolled back: {e}", exc_info=True)
+            raise
+        if conn.in_transaction:
+            conn.execute("RELEASE SAVEPOINT db_connection")
+
+    def close(self):
+        """Close the shared connection, if one is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,2 +1,65 @@
-"""Mock gateway for testing."""
+"""Mock gateway for testing.
 
+StubAdapter stands in for the IBKR gateway at the transport layer. Mounted on
+a requests.Session, it answers every request with the next scripted response,
+without URL matching, urllib3 or network access. Use requests_mock instead
+when a test needs per-URL routing or raised exceptions.
+"""
+
+import json
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+
+class StubAdapter(BaseAdapter):
+    """Transport adapter that replays scripted responses in order.
+
+    Each script entry is a dict using requests_mock's response-list keys:
+    ``status_code`` (default 200), ``json``, ``text`` or pre-encoded ``content``
+    bytes, and ``headers``.
+    Like requests_mock, the last entry is repeated once the script runs out.
+
+    Attributes:
+        requests: PreparedRequests received, in order
+    """
+
+    def __init__(self, script):
+        super().__init__()
+        if not script:
+            raise ValueError("StubAdapter needs at least one scripted response")
+        # Serialize bodies once up front; send() only copies them onto a Response
+        self._script = [self._prepare(entry) for entry in script]
+        self.requests = []
+
+    @staticmethod
+    def _prepare(entry):
+        headers = dict(entry.get("headers", {}))
+        if "content" in entry:
+            body = entry["content"]
+        elif "json" in entry:
+            body = json.dumps(entry["json"]).encode()
+            headers.setdefault("Content-Type", "application/json")
+        else:
+            body = entry.get("text", "").encode()
+        return entry.get("status_code", 200), body, headers
+
+    def send(self, request, **kwargs):
+        """Return the next scripted response for ``request``."""
+        index = min(len(self.requests), len(self._script) - 1)
+        status_code, body, headers = self._script[index]
+        self.requests.append(request)
+
+        response = Response()
+        response.status_code = status_code
+        response._content = body
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        """Nothing to release; present to satisfy BaseAdapter."""
@@ -0,0 +1,49 @@
+"""Bulk seeding helpers for model tests.
+
+Inserts prerequisite Account, Symbol and Position rows directly with executemany,
+skipping per-row ActiveModel validation, for tests that only need the
+rows to exist.
+"""
+
+from tests.fixtures import FIXED_NOW
+
+INSERT_ACCOUNTS_SQL = (
+    "INSERT INTO accounts (id, name, base_currency, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+INSERT_SYMBOLS_SQL = (
+    "INSERT INTO symbols (conid, symbol, sec_type, currency, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+INSERT_POSITIONS_SQL = (
+    "INSERT INTO positions (account_id, symbol_id, quantity, currency, snapshot_ts, "
+    "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def bulk_seed(database, *, accounts=(), symbols=(), positions=()):
+    """Insert accounts, symbols and positions in one transaction.
+
+    Args:
+        database: Database to seed
+        accounts: (id, name, base_currency) tuples
+        symbols: (conid, symbol, sec_type, currency) tuples
+        positions: (account_id, symbol_id, quantity, currency, snapshot_ts) tuples
+    """
+    now = FIXED_NOW
+    tables = (
+        (INSERT_ACCOUNTS_SQL, accounts),
+        (INSERT_SYMBOLS_SQL, symbols),
+        (INSERT_POSITIONS_SQL, positions),
+    )
+    with database.connection() as conn:
+        # Autocommit connections would otherwise commit every row separately
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        cursor = conn.cursor()
+        for sql, rows in tables:
+            # Skip empty tables entirely: the test schema may not define them
+            if rows:
+                cursor.executemany(sql, ((*row, now, now) for row in rows))
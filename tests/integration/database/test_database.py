@@ -9,6 +9,7 @@ import tempfile
 import pytest
 
 from src.database import Database
+from tests.fixtures.database import PersistentDatabase
 
 
 class TestDatabaseIntegration:
@@ -57,12 +58,12 @@ class TestDatabaseIntegration:
 
         with db.connection() as conn:
             cursor = conn.cursor()
-            
+
             # Test WAL mode syntax
             cursor.execute("PRAGMA journal_mode")
             result = cursor.fetchone()
             assert result[0] in ["wal", "WAL"]  # SQLite may return lowercase
-            
+
             # Test foreign keys syntax
             cursor.execute("PRAGMA foreign_keys")
             result = cursor.fetchone()
@@ -128,11 +129,11 @@ class TestDatabaseIntegration:
     def test_connection_creates_parent_directory(self, tmp_path):
         """Test that connection creates parent directory if it doesn't exist."""
         db_path = tmp_path / "subdir" / "nested" / "test.db"
-        
+
         # Verify parent directory doesn't exist before Database creation
         assert not db_path.parent.exists()
         assert not db_path.exists()
-        
+
         db = Database(db_path=str(db_path), encryption_key=None)
 
         # Database.__init__ should have created parent directory
@@ -147,3 +148,101 @@ class TestDatabaseIntegration:
         assert db_path.parent.exists()
         assert db_path.exists()
 
+
+class TestPersistentDatabase:
+    """Integration tests for the test-only PersistentDatabase."""
+
+    def test_persistent_connection_is_reused(self):
+        """Test that connection() yields the same connection every time."""
+        db = PersistentDatabase(db_path=":memory:", encryption_key=None)
+
+        with db.connection() as first:
+            first.execute("CREATE TABLE test_table (id INTEGER PRIMARY KEY)")
+        with db.connection() as second:
+            second.execute("SELECT * FROM test_table")
+
+        assert first is second
+        db.close()
+
+    def test_persistent_connection_rolls_back_failed_block(self):
+        """Test that an exception rolls back only the failing block."""
+        db = PersistentDatabase(db_path=":memory:", encryption_key=None)
+
+        with db.connection() as conn:
+            conn.execute("CREATE TABLE test_table (value TEXT)")
+            conn.execute("INSERT INTO test_table (value) VALUES ('kept')")
+
+        with pytest.raises(RuntimeError):
+            with db.connection() as conn:
+                conn.execute("INSERT INTO test_table (value) VALUES ('discarded')")
+                raise RuntimeError("boom")
+
+        with db.connection() as conn:
+            rows = conn.execute("SELECT value FROM test_table").fetchall()
+
+        assert rows == [("kept",)]
+        db.close()
+
+    def test_persistent_connection_rolls_back_on_base_exception(self):
+        """Test that a BaseException such as KeyboardInterrupt also rolls back."""
+        db = PersistentDatabase(db_path=":memory:", encryption_key=None)
+
+        with db.connection() as conn:
+            conn.execute("CREATE TABLE test_table (value TEXT)")
+
+        with pytest.raises(KeyboardInterrupt):
+            with db.connection() as conn:
+                conn.execute("INSERT INTO test_table (value) VALUES ('discarded')")
+                raise KeyboardInterrupt
+
+        with db.connection() as conn:
+            rows = conn.execute("SELECT value FROM test_table").fetchall()
+
+        assert not conn.in_transaction
+        assert rows == []
+        db.close()
+
+    def test_persistent_connection_tolerates_caller_commit(self):
+        """Test that a block may commit or run executescript() itself."""
+        db = PersistentDatabase(db_path=":memory:", encryption_key=None)
+
+        with db.connection() as conn:
+            conn.executescript(
+                "CREATE TABLE test_table (value TEXT);"
+                "INSERT INTO test_table (value) VALUES ('scripted');"
+            )
+
+        with db.connection() as conn:
+            rows = conn.execute("SELECT value FROM test_table").fetchall()
+
+        assert rows == [("scripted",)]
+        db.close()
+
+    def test_extra_pragmas_are_applied(self, temp_db_path):
+        """Test that extra PRAGMAs are applied after the defaults."""
+        db = Database(
+            db_path=temp_db_path,
+            encryption_key=None,
+            pragmas={"journal_mode": "MEMORY", "synchronous": "OFF"},
+        )
+
+        with db.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_shared_memory_uri_is_visible_to_other_instances(self):
+        """Test that a named shared-cache memory URI is shared in-process."""
+        uri = "file:shared_uri_test?mode=memory&cache=shared"
+        owner = PersistentDatabase(db_path=uri, encryption_key=None)
+
+        with owner.connection() as conn:
+            conn.execute("CREATE TABLE test_table (value TEXT)")
+            conn.execute("INSERT INTO test_table (value) VALUES ('shared')")
+
+        reader = Database(db_path=uri, encryption_key=None)
+        with reader.connection() as conn:
+            rows = conn.execute("SELECT value FROM test_table").fetchall()
+
+        assert rows == [("shared",)]
+        owner.close()
@@ -12,6 +12,7 @@ from src.database import (
     DatabaseConnectionError,
     SQLiteError,
     _sanitize_encryption_key,
+    _validate_pragmas,
 )
 
 
@@ -128,6 +129,16 @@ class TestSQLInjectionPrevention:
         with pytest.raises(ValueError, match="invalid characters"):
             _sanitize_encryption_key("'; DROP TABLE accounts; --")
 
+    def test_sanitize_encryption_key_rejects_non_ascii_letters(self):
+        """Test that non-ASCII alphanumerics do not slip through the fast path."""
+        with pytest.raises(ValueError, match="invalid characters"):
+            _sanitize_encryption_key("clé-secrète")
+
+    def test_sanitize_encryption_key_rejects_empty_key(self):
+        """Test that an empty key is rejected."""
+        with pytest.raises(ValueError, match="invalid characters"):
+            _sanitize_encryption_key("")
+
     def test_connect_rejects_invalid_encryption_key(self):
         """Test that _connect rejects invalid encryption key format before connecting."""
         with patch("src.database.sqlite3") as mock_sqlite3:
@@ -163,6 +174,34 @@ class TestSQLInjectionPrevention:
                     # Verify no quotes in the sanitized key (it was already valid)
                     assert "valid-key-123456" in str(encryption_calls[0])
 
+    def test_validate_pragmas_accepts_allowed_pragmas(self):
+        """Test that allowed names with plain values pass and values become str."""
+        pragmas = {"journal_mode": "MEMORY", "cache_size": -20000}
+        assert _validate_pragmas(pragmas) == {
+            "journal_mode": "MEMORY",
+            "cache_size": "-20000",
+        }
+
+    def test_validate_pragmas_rejects_unknown_name(self):
+        """Test that PRAGMA names outside the allowlist are rejected."""
+        with pytest.raises(ValueError, match="not allowed"):
+            _validate_pragmas({"writable_schema": "ON"})
+
+    @pytest.mark.parametrize(
+        "value", ["OFF; DROP TABLE accounts", "MEMORY\n", "'OFF'", ""]
+    )
+    def test_validate_pragmas_rejects_invalid_value(self, value):
+        """Test that values outside [A-Za-z0-9_-]+ are rejected."""
+        with pytest.raises(ValueError, match="invalid characters"):
+            _validate_pragmas({"synchronous": value})
+
+    def test_initialization_rejects_invalid_pragmas(self):
+        """Test that Database validates pragmas before any connection is made."""
+        with patch("src.database.sqlite3") as mock_sqlite3:
+            with pytest.raises(ValueError, match="not allowed"):
+                Database(db_path=":memory:", pragmas={"key": "secret"})
+            mock_sqlite3.connect.assert_not_called()
+
 
 class TestDatabaseConnection:
     """Test Database connection management with mocks."""
@@ -192,6 +231,19 @@ class TestDatabaseConnection:
 
         assert conn == mock_conn
 
+    @patch("src.database.sqlite3")
+    def test_connect_passes_cached_statements_when_set(self, mock_sqlite3):
+        """Test that cached_statements is forwarded to sqlite3.connect."""
+        db = Database(db_path=":memory:", encryption_key=None, cached_statements=256)
+        db._connect()
+
+        mock_sqlite3.connect.assert_called_once_with(
+            ":memory:",
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+
     @patch("src.database.sqlite3")
     @patch("src.database.Path")
     def test_connect_sets_encryption_when_enabled(self, mock_path, mock_sqlite3):
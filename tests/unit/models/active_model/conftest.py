@@ -0,0 +1,48 @@
+"""Fixtures shared by the ActiveModel test modules."""
+
+import pytest
+
+from tests.fixtures.active_models import HOOK_CALLS, SCHEMA_SQL
+from tests.fixtures.seed import bulk_seed
+
+
+@pytest.fixture(scope="package")
+def active_model_schema(test_db):
+    """Create the minimal accounts and positions tables once for the package."""
+    with test_db.connection() as conn:
+        conn.executescript(SCHEMA_SQL)
+    yield
+    with test_db.connection() as conn:
+        conn.executescript("DROP TABLE positions; DROP TABLE accounts;")
+
+
+@pytest.fixture(autouse=True)
+def _rollback_writes(active_model_schema, db_savepoint):
+    """Roll back each test's writes once the schema exists."""
+
+
+@pytest.fixture
+def conn(test_db):
+    """One connection block held open for the whole test.
+
+    Model calls made during the test nest inside it as savepoints.
+    """
+    with test_db.connection() as connection:
+        yield connection
+
+
+@pytest.fixture
+def seeded_accounts(test_db, request):
+    """Database with request.param (id, name, base_currency) rows in accounts.
+
+    Use with @pytest.mark.parametrize("seeded_accounts", [ROWS], indirect=True).
+    """
+    bulk_seed(test_db, accounts=request.param)
+    return test_db
+
+
+@pytest.fixture
+def hook_calls():
+    """Recorded hook calls for the current test."""
+    HOOK_CALLS.clear()
+    return HOOK_CALLS
@@ -0,0 +1,332 @@
+"""Unit tests for base ActiveModel class (ActiveRecord pattern).
+
+Tests the base ActiveModel class that provides ActiveRecord-style persistence.
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from src.database import Database
+from src.models.active_model import ActiveModel, ActiveModelError
+from tests.fixtures.active_models import (
+    ACCOUNTS_USD_EUR,
+    SCHEMA_SQL,
+    SEED_POSITION_SQL,
+    AccountTestActiveModel,
+    PositionTestActiveModel,
+)
+from tests.fixtures.seed import bulk_seed
+
+
+class TestActiveModelBase:
+    """Test base ActiveModel class functionality."""
+
+    def test_active_model_requires_table_name(self, test_db):
+        """Test that ActiveModel subclasses must define table_name."""
+
+        # Should fail if table_name is missing
+        class InvalidActiveModel(ActiveModel):
+            pass
+
+        with pytest.raises(AttributeError, match="table_name"):
+            InvalidActiveModel(test_db)
+
+    def test_active_model_requires_primary_key(self, test_db):
+        """Test that ActiveModel subclasses must define primary_key."""
+
+        class InvalidActiveModel(ActiveModel):
+            table_name = "test"
+
+        with pytest.raises(AttributeError, match="primary_key"):
+            InvalidActiveModel(test_db)
+
+    def test_active_model_stores_database(self, test_db):
+        """Test that ActiveModel stores Database instance."""
+        account = AccountTestActiveModel(
+            test_db, id="U1234567", name="Test", base_currency="USD"
+        )
+        assert account._database is test_db
+
+    def test_save_creates_new_record(self, test_db):
+        """Test that save() creates a new record when id is None (INTEGER PK)."""
+        position = PositionTestActiveModel(test_db, quantity=100.0, currency="USD")
+        position.id = None  # New record
+
+        # This test will verify save() calls INSERT
+        # Implementation will use parameterized queries
+        result = position.save()
+        assert result is True
+        assert position.id is not None
+        assert position.created_at is not None
+        assert position.updated_at is not None
+
+    def test_save_updates_existing_record(self, test_db, conn):
+        """Test that save() updates existing record when id is set."""
+        # Insert initial record
+        conn.execute(SEED_POSITION_SQL)
+
+        position = PositionTestActiveModel(
+            test_db, id=1, quantity=200.0, currency="USD"
+        )
+        original_updated_at = position.updated_at = "sentinel-updated-at"
+
+        result = position.save()
+        assert result is True
+        # updated_at should change
+        assert position.updated_at != original_updated_at
+
+        # Verify update in database
+        cursor = conn.cursor()
+        cursor.execute("SELECT quantity FROM positions WHERE id = ?", (1,))
+        row = cursor.fetchone()
+        assert row[0] == 200.0
+
+    def test_delete_removes_record(self, test_db, conn):
+        """Test that delete() removes the record from database."""
+        conn.execute(SEED_POSITION_SQL)
+
+        position = PositionTestActiveModel(test_db, id=1)
+        result = position.delete()
+        assert result is True
+
+        # Verify deleted
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM positions WHERE id = ?", (1,))
+        count = cursor.fetchone()[0]
+        assert count == 0
+
+    def test_reload_refreshes_attributes_from_database(self, test_db, conn):
+        """Test that reload() re-reads the stored row into the instance."""
+        conn.execute(SEED_POSITION_SQL)
+        position = PositionTestActiveModel(test_db, id=1, quantity=999.0)
+
+        assert position.reload() is position
+        assert position.quantity == 100.0
+        assert position.currency == "USD"
+
+    def test_reload_raises_when_row_is_gone(self, test_db):
+        """Test that reload() raises if the record no longer exists."""
+        position = PositionTestActiveModel(test_db, id=1)
+
+        with pytest.raises(ActiveModelError, match="no longer exists"):
+            position.reload()
+
+    def test_bulk_save_inserts_every_record(self, test_db, conn):
+        """Test that bulk_save() inserts every record with the same INSERT."""
+        positions = [
+            PositionTestActiveModel(test_db, quantity=float(i), currency="USD")
+            for i in range(3)
+        ]
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            inserted = PositionTestActiveModel.bulk_save(test_db, positions)
+        finally:
+            conn.set_trace_callback(None)
+
+        assert inserted == 3
+        # Every row is traced separately, but it is the same prepared INSERT
+        inserts = {sql for sql in statements if sql.startswith("INSERT")}
+        assert len(inserts) == 3
+        assert {sql.split(" VALUES")[0] for sql in inserts} == {
+            "INSERT INTO positions (quantity, currency, created_at, updated_at)"
+        }
+        quantities = PositionTestActiveModel.pluck(test_db, "quantity")
+        assert sorted(quantities) == [0.0, 1.0, 2.0]
+
+    def test_bulk_save_keeps_no_rows_when_one_fails(self, test_db, conn):
+        """Test that bulk_save() rolls back every row if any insert fails."""
+        positions = [
+            PositionTestActiveModel(test_db, quantity=1.0, currency="USD"),
+            PositionTestActiveModel(test_db, quantity=2.0, currency=None),
+        ]
+
+        with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
+            PositionTestActiveModel.bulk_save(test_db, positions)
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM positions")
+        assert cursor.fetchone()[0] == 0
+
+    def test_bulk_save_rejects_already_saved_records(self, test_db, conn):
+        """Test that bulk_save() refuses instances whose INTEGER id is set."""
+        saved = PositionTestActiveModel(test_db, quantity=1.0, currency="USD")
+        saved.save()
+        positions = [
+            PositionTestActiveModel(test_db, quantity=2.0, currency="USD"),
+            saved,
+        ]
+
+        with pytest.raises(ValueError, match="already saved"):
+            PositionTestActiveModel.bulk_save(test_db, positions)
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT quantity FROM positions")
+        assert cursor.fetchall() == [(1.0,)]
+
+    @pytest.mark.parametrize(
+        "finder, kwargs, expected_names",
+        [
+            ("find_by_id", {"pk_value": "U1234567"}, ["Account 1"]),
+            ("find_by_id", {"pk_value": "NOTEXIST"}, []),
+            ("find_by", {"base_currency": "USD"}, ["Account 1"]),
+            ("find_by", {"base_currency": "EUR"}, []),
+            ("where", {"base_currency": "USD"}, ["Account 1", "Account 2"]),
+            ("where", {"base_currency": "EUR"}, []),
+            ("all", {}, ["Account 1", "Account 2"]),
+        ],
+    )
+    def test_finders_return_matching_records(
+        self, test_db, finder, kwargs, expected_names
+    ):
+        """Test that find_by_id/find_by/where/all return the matching records."""
+        bulk_seed(
+            test_db,
+            accounts=[
+                ("U1234567", "Account 1", "USD"),
+                ("U7654321", "Account 2", "USD"),
+            ],
+        )
+
+        result = getattr(AccountTestActiveModel, finder)(test_db, **kwargs)
+        # find_by_id/find_by return one record or None; where/all return a list
+        if finder in ("where", "all"):
+            assert isinstance(result, list)
+            records = result
+        elif expected_names:
+            assert isinstance(result, AccountTestActiveModel)
+            records = [result]
+        else:
+            assert result is None
+            records = []
+
+        assert sorted(record.name for record in records) == expected_names
+        assert all(isinstance(r, AccountTestActiveModel) for r in records)
+        currencies = [r.base_currency for r in records]
+        assert currencies == ["USD"] * len(records)
+
+    @pytest.mark.parametrize(
+        "kwargs, expected_ids",
+        [
+            ({}, ["U1", "U2"]),
+            ({"base_currency": "EUR"}, ["U2"]),
+            ({"base_currency": "GBP"}, []),
+        ],
+    )
+    @pytest.mark.parametrize("seeded_accounts", [ACCOUNTS_USD_EUR], indirect=True)
+    def test_pluck_returns_column_values(self, seeded_accounts, kwargs, expected_ids):
+        """Test that pluck() returns plain values of one column."""
+        ids = AccountTestActiveModel.pluck(seeded_accounts, "id", **kwargs)
+        assert sorted(ids) == expected_ids
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({}, 2),
+            ({"base_currency": "EUR"}, 1),
+            ({"base_currency": "GBP"}, 0),
+        ],
+    )
+    @pytest.mark.parametrize("seeded_accounts", [ACCOUNTS_USD_EUR], indirect=True)
+    def test_count_returns_number_of_matches(self, seeded_accounts, kwargs, expected):
+        """Test that count() returns how many records match."""
+        assert AccountTestActiveModel.count(seeded_accounts, **kwargs) == expected
+
+    def test_all_returns_empty_list_for_empty_table(self, test_db):
+        """Test that all() returns an empty list when the table is empty."""
+        assert AccountTestActiveModel.all(test_db) == []
+
+    def test_invalid_fields_defaults_to_columns(self, test_db):
+        """Test that _invalid_fields() checks columns when no _allowed_fields."""
+
+        class ColumnsOnlyModel(PositionTestActiveModel):
+            columns = ("id", "quantity", "currency", "created_at", "updated_at")
+
+        position = ColumnsOnlyModel(test_db, quantity=1.0, currency="USD")
+        assert position._invalid_fields() == set()
+
+        position.extra = "not a column"
+        assert position._invalid_fields() == {"extra"}
+
+    def test_invalid_fields_empty_without_declared_fields(self, test_db):
+        """Test that _invalid_fields() allows anything without columns."""
+        account = AccountTestActiveModel(test_db, id="U1", extra="stored as-is")
+        assert account._invalid_fields() == set()
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """Plain file-backed Database: one autocommit connection per block."""
+    database = Database(db_path=str(tmp_path / "bulk_save.db"))
+    with database.connection() as conn:
+        conn.executescript(SCHEMA_SQL)
+    return database
+
+
+def _position_count(database):
+    """Count positions through a fresh connection, i.e. only committed rows."""
+    with database.connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+
+
+class TestBulkSaveOwnTransaction:
+    """Test bulk_save() when no outer transaction is open."""
+
+    def test_bulk_save_uses_one_executemany(self, file_db):
+        """Test that bulk_save() inserts every record with one executemany."""
+        executemany_calls = []
+
+        class SpyCursor(sqlite3.Cursor):
+            def executemany(self, sql, rows):
+                rows = list(rows)
+                executemany_calls.append((sql, len(rows)))
+                return super().executemany(sql, rows)
+
+        class SpyConnection(sqlite3.Connection):
+            def cursor(self, factory=SpyCursor):
+                return super().cursor(factory)
+
+        real_connect = sqlite3.connect
+        positions = [
+            PositionTestActiveModel(file_db, quantity=float(i), currency="USD")
+            for i in range(3)
+        ]
+        with patch(
+            "src.database.sqlite3.connect",
+            lambda *args, **kwargs: real_connect(
+                *args, factory=SpyConnection, **kwargs
+            ),
+        ):
+            assert PositionTestActiveModel.bulk_save(file_db, positions) == 3
+
+        assert executemany_calls == [
+            (
+                "INSERT INTO positions (quantity, currency, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                3,
+            )
+        ]
+
+    def test_bulk_save_commits_its_own_transaction(self, file_db):
+        """Test that bulk_save() BEGINs and connection() commits on success."""
+        positions = [
+            PositionTestActiveModel(file_db, quantity=float(i), currency="USD")
+            for i in range(3)
+        ]
+
+        assert PositionTestActiveModel.bulk_save(file_db, positions) == 3
+        assert _position_count(file_db) == 3
+
+    def test_bulk_save_rolls_back_its_own_transaction(self, file_db):
+        """Test that connection() rolls back every row if any insert fails."""
+        positions = [
+            PositionTestActiveModel(file_db, quantity=1.0, currency="USD"),
+            PositionTestActiveModel(file_db, quantity=2.0, currency=None),
+        ]
+
+        with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
+            PositionTestActiveModel.bulk_save(file_db, positions)
+
+        assert _position_count(file_db) == 0
@@ -0,0 +1,186 @@
+"""Unit tests for ActiveModel edge cases and error scenarios."""
+
+import pytest
+
+from src.models.active_model import MissingPrimaryKeyError
+from tests.fixtures.active_models import (
+    ACCOUNTS_USD_USD_EUR,
+    SEED_POSITION_SQL,
+    AccountTestActiveModel,
+    PositionTestActiveModel,
+)
+from tests.fixtures.clock import TickingClock
+
+
+class TestActiveModelEdgeCases:
+    """Test edge cases and error scenarios for ActiveModel."""
+
+    def test_text_primary_key_requires_id_for_new_record(self, test_db):
+        """Test that TEXT primary key must be provided for new records."""
+        # Missing id should raise ValueError
+        account = AccountTestActiveModel(test_db, name="Test", base_currency="USD")
+        account.id = None  # Explicitly set to None
+
+        with pytest.raises(ValueError, match="id is required for new"):
+            account.save()
+
+    def test_text_primary_key_saves_when_id_provided(self, test_db, conn):
+        """Test that TEXT primary key saves successfully when id is provided."""
+        account = AccountTestActiveModel(
+            test_db, id="U1234567", name="Test Account", base_currency="USD"
+        )
+
+        result = account.save()
+        assert result is True
+        assert account.id == "U1234567"
+
+        # Verify saved to database (use same connection context to ensure visibility)
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM accounts WHERE id = ?", ("U1234567",))
+        row = cursor.fetchone()
+        assert row is not None, "Record should exist in database"
+        assert row[0] == "Test Account"
+
+    def test_update_with_no_fields_raises_error(self, test_db, conn):
+        """Test that UPDATE with no fields to update raises ValueError.
+
+        Note: updated_at is always set in UPDATE path, so we need to create
+        a scenario where even updated_at is missing. This tests the edge case
+        where _get_attributes() returns only the primary key.
+        """
+        # Insert initial record
+        conn.execute(SEED_POSITION_SQL)
+
+        position = PositionTestActiveModel(test_db, id=1)
+
+        # Mock _get_attributes to return only primary key
+        # (simulating the edge case where no other fields exist)
+        def mock_get_attrs():
+            # Return only primary key - simulates worst case
+            return {position.primary_key: getattr(position, position.primary_key)}
+
+        position._get_attributes = mock_get_attrs
+
+        with pytest.raises(ValueError, match="No fields to update"):
+            position.save()
+
+    def test_get_attributes_excludes_private_fields(self, test_db):
+        """Test that _get_attributes() excludes private fields starting with _."""
+        position = PositionTestActiveModel(test_db, quantity=100.0, currency="USD")
+        position._private_field = "should_not_appear"
+        position._another_private = "also_hidden"
+        position.public_field = "should_appear"
+
+        attrs = position._get_attributes()
+
+        assert "_private_field" not in attrs
+        assert "_another_private" not in attrs
+        assert "_database" not in attrs
+        assert "public_field" in attrs
+        assert attrs["public_field"] == "should_appear"
+        assert "quantity" in attrs
+        assert "currency" in attrs
+
+    def test_get_attributes_excludes_database_instance(self, test_db):
+        """Test that _get_attributes() excludes _database instance."""
+        position = PositionTestActiveModel(test_db, quantity=100.0, currency="USD")
+
+        attrs = position._get_attributes()
+
+        assert "_database" not in attrs
+        assert position._database is test_db  # But it still exists on instance
+
+    def test_get_attributes_reads_declared_columns_only(self, test_db):
+        """Test that _get_attributes() reads only declared columns when set."""
+
+        class ColumnsPositionModel(PositionTestActiveModel):
+            columns = ("id", "quantity", "currency", "created_at", "updated_at")
+
+        position = ColumnsPositionModel(test_db, quantity=100.0, currency="USD")
+        position.public_field = "not_a_column"
+
+        attrs = position._get_attributes()
+
+        # id was never set, so it is left out rather than sent as None
+        assert list(attrs) == ["quantity", "currency", "created_at", "updated_at"]
+        assert attrs["quantity"] == 100.0
+
+    def test_timestamps_auto_set_on_new_instance(self, test_db):
+        """Test that created_at and updated_at are auto-set on new instances."""
+        position = PositionTestActiveModel(test_db, quantity=100.0, currency="USD")
+
+        assert hasattr(position, "created_at")
+        assert hasattr(position, "updated_at")
+        assert position.created_at is not None
+        assert position.updated_at is not None
+        # Verify they are ISO format strings
+        assert isinstance(position.created_at, str)
+        assert isinstance(position.updated_at, str)
+        assert "T" in position.created_at or position.created_at.endswith("Z")
+
+    def test_provided_timestamps_are_preserved(self, test_db):
+        """Test that provided timestamps are preserved on initialization."""
+        custom_created = "2025-01-01T00:00:00Z"
+        custom_updated = "2025-01-02T00:00:00Z"
+
+        position = PositionTestActiveModel(
+            test_db,
+            quantity=100.0,
+            currency="USD",
+            created_at=custom_created,
+            updated_at=custom_updated,
+        )
+
+        assert position.created_at == custom_created
+        assert position.updated_at == custom_updated
+
+    def test_delete_with_none_primary_key_raises_error(self, test_db):
+        """Test that delete() raises MissingPrimaryKeyError when primary key is None."""
+        position = PositionTestActiveModel.raw(test_db, id=None, quantity=100.0)
+
+        with pytest.raises(MissingPrimaryKeyError):
+            position.delete()
+
+    @pytest.mark.parametrize(
+        "kwargs, expected_count, allowed_ids",
+        [
+            ({}, 3, {"U1", "U2", "U3"}),
+            ({"_limit": 2}, 2, {"U1", "U2", "U3"}),
+            ({"base_currency": "USD", "_limit": 1}, 1, {"U1", "U2"}),
+            ({"base_currency": "USD", "name": "Account 1"}, 1, {"U1"}),
+            # SQL injection attempt is bound as a literal value, so no match
+            ({"base_currency": "USD' OR '1'='1"}, 0, set()),
+        ],
+        ids=["no_kwargs", "limit", "filter_and_limit", "multiple", "injection"],
+    )
+    @pytest.mark.parametrize("seeded_accounts", [ACCOUNTS_USD_USD_EUR], indirect=True)
+    def test_where(self, seeded_accounts, kwargs, expected_count, allowed_ids):
+        """Test where() with empty kwargs, _limit, several conditions and injection."""
+        accounts = AccountTestActiveModel.where(seeded_accounts, **kwargs)
+
+        assert len(accounts) == expected_count
+        assert {acc.id for acc in accounts} <= allowed_ids
+
+    def test_update_with_only_primary_key_works(self, test_db, conn, monkeypatch):
+        """Test that UPDATE works when only primary key and timestamps are present."""
+        # Insert initial record
+        conn.execute(SEED_POSITION_SQL)
+        # Advance the model's clock on every call instead of sleeping
+        monkeypatch.setattr("src.models.active_model.datetime", TickingClock())
+
+        # Create model with id and timestamps (which count as updateable fields)
+        position = PositionTestActiveModel(test_db, id=1)
+        original_updated_at = position.updated_at
+
+        result = position.save()
+        assert result is True
+
+        # updated_at should have changed
+        assert position.updated_at > original_updated_at
+
+        # Verify quantity and currency unchanged in database
+        cursor = conn.cursor()
+        cursor.execute("SELECT quantity, currency FROM positions WHERE id = ?", (1,))
+        row = cursor.fetchone()
+        assert row[0] == 100.0
+        assert row[1] == "USD"
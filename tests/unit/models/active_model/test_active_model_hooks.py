@@ -0,0 +1,128 @@
+"""Unit tests for ActiveModel save hooks."""
+
+import pytest
+
+from src.models.active_model import ActiveModelError
+from tests.fixtures.active_models import (
+    SEED_POSITION_SQL,
+    BrokenSaveModel,
+    ComputedFieldModel,
+    IsNewRecordingModel,
+    RecordingHooksModel,
+    RejectingHooksModel,
+    SavedIdRecordingModel,
+    UppercaseCurrencyModel,
+)
+
+
+class TestActiveModelSaveHooks:
+    """Test save() hook methods (_before_save, _save_to_database, _after_save)."""
+
+    def test_before_save_hook_called_before_database_operation(
+        self, test_db, hook_calls
+    ):
+        """Test that _before_save() is called before database operations."""
+        active_model = RecordingHooksModel(test_db, quantity=100.0, currency="USD")
+        active_model.id = None  # New record
+
+        active_model.save()
+
+        assert hook_calls[:2] == ["before", "save"]
+
+    def test_after_save_hook_called_after_database_operation(self, test_db, hook_calls):
+        """Test that _after_save() is called after successful save."""
+        active_model = RecordingHooksModel(test_db, quantity=100.0, currency="USD")
+        active_model.id = None  # New record
+
+        active_model.save()
+
+        assert "save" in hook_calls
+        assert "after" in hook_calls
+        assert hook_calls.index("save") < hook_calls.index("after")
+
+    def test_before_save_can_prevent_save_with_exception(self, test_db, hook_calls):
+        """Test that _before_save() can raise exception to prevent saving."""
+        active_model = RejectingHooksModel(test_db, quantity=100.0, currency="USD")
+        active_model.id = None  # New record
+
+        with pytest.raises(ActiveModelError, match="Validation failed"):
+            active_model.save()
+
+        # Should not call _save_to_database or _after_save
+        assert hook_calls == ["before"]
+
+    def test_before_save_can_modify_attributes(self, test_db, conn):
+        """Test that _before_save() can modify attributes before saving."""
+        active_model = UppercaseCurrencyModel(test_db, quantity=100.0, currency="usd")
+        active_model.id = None  # New record
+
+        active_model.save()
+
+        # Verify currency was normalized to uppercase in database
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT currency FROM positions WHERE id = ?", (active_model.id,)
+        )
+        row = cursor.fetchone()
+        assert row[0] == "USD"
+
+    def test_after_save_hook_receives_saved_instance(self, test_db, hook_calls):
+        """Test that _after_save() is called with saved instance."""
+        active_model = SavedIdRecordingModel(test_db, quantity=100.0, currency="USD")
+        active_model.id = None  # New record
+
+        active_model.save()
+
+        # _after_save should see the auto-generated ID
+        assert len(hook_calls) == 1
+        assert hook_calls[0] is not None
+        assert hook_calls[0] == active_model.id
+
+    def test_custom_save_to_database_override(self, test_db, conn, hook_calls):
+        """Test that subclasses can override _save_to_database() completely."""
+        active_model = ComputedFieldModel(test_db, quantity=100.0, currency="USD")
+        active_model.id = None  # New record
+
+        active_model.save()
+
+        assert hook_calls == ["custom_save"]
+
+        # Verify custom save worked
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT computed_field FROM positions WHERE id = ?", (active_model.id,)
+        )
+        row = cursor.fetchone()
+        assert row[0] == "computed_value"
+
+    def test_custom_save_to_database_for_update(self, test_db, conn, hook_calls):
+        """Test that _save_to_database() receives is_new=False for updates."""
+        # Insert initial record
+        conn.execute(SEED_POSITION_SQL)
+
+        active_model = IsNewRecordingModel(
+            test_db, id=1, quantity=200.0, currency="USD"
+        )
+
+        active_model.save()
+
+        assert hook_calls == [False]  # is_new should be False for update
+
+    def test_after_save_not_called_on_database_error(self, test_db, hook_calls):
+        """Test that _after_save() is not called if database operation fails."""
+        active_model = BrokenSaveModel(test_db, quantity=100.0, currency="USD")
+        active_model.id = None  # New record
+
+        with pytest.raises(Exception):  # SQLiteError or similar
+            active_model.save()
+
+        assert "after" not in hook_calls
+
+    def test_save_calls_all_hooks_in_order(self, test_db, hook_calls):
+        """Test that save() calls all hooks in correct order."""
+        active_model = RecordingHooksModel(test_db, quantity=100.0, currency="USD")
+        active_model.id = None  # New record
+
+        active_model.save()
+
+        assert hook_calls == ["before", "save", "after"]
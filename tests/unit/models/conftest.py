@@ -0,0 +1,13 @@
+"""Fixtures shared by the model test modules."""
+
+import pytest
+
+
+@pytest.fixture(scope="package")
+def test_db(memory_db):
+    """Session-wide in-memory database shared by the model tests.
+
+    Each module creates (and drops) its own tables on it, and requests
+    ``db_savepoint`` to roll back per-test writes.
+    """
+    return memory_db
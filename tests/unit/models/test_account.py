@@ -3,12 +3,51 @@
 Tests the Account model's validation, persistence, and query methods.
 """
 
-from datetime import datetime
-
 import pytest
 
 from src.models.account import Account
 from src.models.active_model import ActiveModelError
+from tests.fixtures.seed import bulk_seed
+
+pytestmark = pytest.mark.usefixtures("db_savepoint")
+
+_ACCOUNTS_DDL = """
+    CREATE TABLE accounts (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        base_currency TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+"""
+
+
+@pytest.fixture(scope="module")
+def accounts_schema(test_db):
+    """Create the accounts table once for the module."""
+    with test_db.connection() as conn:
+        conn.execute(_ACCOUNTS_DDL)
+    yield
+    with test_db.connection() as conn:
+        conn.execute("DROP TABLE accounts")
+
+
+@pytest.fixture
+def seed_one_account(test_db, accounts_schema, db_savepoint):
+    """Seed a single USD account; rolled back with the test's savepoint."""
+    bulk_seed(test_db, accounts=[("U1234567", "Test Account", "USD")])
+
+
+@pytest.fixture(scope="class")
+def seed_query_accounts(test_db, accounts_schema):
+    """Seed two USD accounts once for a class of read-only tests."""
+    bulk_seed(
+        test_db,
+        accounts=[("U1234567", "Account 1", "USD"), ("U7654321", "Account 2", "USD")],
+    )
+    yield
+    with test_db.connection() as conn:
+        conn.execute("DELETE FROM accounts")
 
 
 class TestAccountFieldValidation:
@@ -53,40 +92,21 @@ class TestAccountFieldValidation:
 class TestAccountValidation:
     """Test Account business rule validation."""
 
-    def test_validate_requires_base_currency_usd(self, test_db):
-        """Test that validate() requires base_currency to be USD."""
-        account = Account(
-            database=test_db,
-            id="U1234567",
-            name="Test Account",
-            base_currency="EUR",  # Invalid
-        )
-
-        with pytest.raises(ActiveModelError, match="Base currency must be USD"):
-            account.validate()
-
-    def test_validate_requires_name(self, test_db):
-        """Test that validate() requires name field."""
-        account = Account(
-            database=test_db,
-            id="U1234567",
-            name="",  # Empty name
-            base_currency="USD",
-        )
-
-        with pytest.raises(ActiveModelError, match="name is required"):
-            account.validate()
-
-    def test_validate_requires_id(self, test_db):
-        """Test that validate() requires id field."""
-        account = Account(
-            database=test_db,
-            id="",  # Empty id
-            name="Test Account",
-            base_currency="USD",
-        )
-
-        with pytest.raises(ActiveModelError, match="ID is required"):
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            ({"base_currency": "EUR"}, "Base currency must be USD"),
+            ({"name": ""}, "name is required"),
+            ({"id": ""}, "ID is required"),
+        ],
+        ids=["base_currency_usd", "name", "id"],
+    )
+    def test_validate_requires_field(self, test_db, overrides, message):
+        """Test that validate() rejects a missing or invalid required field."""
+        fields = {"id": "U1234567", "name": "Test Account", "base_currency": "USD"}
+        account = Account(database=test_db, **{**fields, **overrides})
+
+        with pytest.raises(ActiveModelError, match=message):
             account.validate()
 
     def test_validate_passes_with_valid_data(self, test_db):
@@ -122,23 +142,8 @@ class TestAccountValidation:
 class TestAccountSave:
     """Test Account save() method with validation."""
 
-    def test_save_validates_before_saving(self, test_db):
+    def test_save_validates_before_saving(self, test_db, accounts_schema):
         """Test that save() calls validate() before saving."""
-        # Create schema first
-        with test_db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    base_currency TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """
-            )
-
         account = Account(
             database=test_db,
             id="U1234567",
@@ -150,23 +155,8 @@ class TestAccountSave:
         with pytest.raises(ActiveModelError, match="Base currency must be USD"):
             account.save()
 
-    def test_save_creates_new_account(self, test_db):
+    def test_save_creates_new_account(self, test_db, accounts_schema):
         """Test that save() creates a new account record."""
-        # Create schema first
-        with test_db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    base_currency TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """
-            )
-
         account = Account(
             database=test_db,
             id="U1234567",
@@ -183,142 +173,58 @@ class TestAccountSave:
         # Verify record exists in database
         with test_db.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM accounts WHERE id = ?", ("U1234567",))
+            cursor.execute(
+                "SELECT id, name, base_currency, created_at, updated_at "
+                "FROM accounts WHERE id = ?",
+                ("U1234567",),
+            )
             row = cursor.fetchone()
             assert row is not None
             assert row[0] == "U1234567"  # id
             assert row[1] == "Test Account"  # name
 
-    def test_save_updates_existing_account(self, test_db):
+    def test_save_updates_existing_account(self, test_db, seed_one_account):
         """Test that save() updates existing account."""
-        # Create schema and initial record
-        with test_db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    base_currency TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """
-            )
-            now = datetime.utcnow().isoformat()
-            cursor.execute(
-                (
-                    "INSERT INTO accounts "
-                    "(id, name, base_currency, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?)"
-                ),
-                ("U1234567", "Original Name", "USD", now, now),
-            )
-
         # Load and update
         account = Account.find_by_id(test_db, "U1234567")
         assert account is not None
-        assert account.name == "Original Name"
+        assert account.name == "Test Account"
 
         account.name = "Updated Name"
         result = account.save()
         assert result is True
 
         # Verify update
-        updated = Account.find_by_id(test_db, "U1234567")
-        assert updated.name == "Updated Name"
+        with test_db.connection() as conn:
+            row = conn.execute(
+                "SELECT name FROM accounts WHERE id = ?", ("U1234567",)
+            ).fetchone()
+        assert row == ("Updated Name",)
 
 
+@pytest.mark.usefixtures("seed_query_accounts")
 class TestAccountQueries:
-    """Test Account query methods (find_by_id, find_by, where, all)."""
+    """Test Account query methods (find_by_id, find_by, where, all).
+
+    These tests are read-only, so the rows are seeded once for the class.
+    """
 
     def test_find_by_id_returns_account(self, test_db):
         """Test that find_by_id() returns Account instance."""
-        # Create schema and test data
-        with test_db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    base_currency TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """
-            )
-            now = datetime.utcnow().isoformat()
-            cursor.execute(
-                (
-                    "INSERT INTO accounts "
-                    "(id, name, base_currency, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?)"
-                ),
-                ("U1234567", "Test Account", "USD", now, now),
-            )
-
         account = Account.find_by_id(test_db, "U1234567")
         assert account is not None
         assert isinstance(account, Account)
         assert account.id == "U1234567"
-        assert account.name == "Test Account"
+        assert account.name == "Account 1"
         assert account.base_currency == "USD"
 
     def test_find_by_id_returns_none_when_not_found(self, test_db):
         """Test that find_by_id() returns None for non-existent account."""
-        # Create schema only (no data)
-        with test_db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    base_currency TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """
-            )
-
         account = Account.find_by_id(test_db, "NOTEXIST")
         assert account is None
 
     def test_find_by_returns_first_match(self, test_db):
         """Test that find_by() returns first matching Account."""
-        # Create schema and test data
-        with test_db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    base_currency TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """
-            )
-            now = datetime.utcnow().isoformat()
-            cursor.execute(
-                (
-                    "INSERT INTO accounts "
-                    "(id, name, base_currency, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?)"
-                ),
-                ("U1234567", "Account 1", "USD", now, now),
-            )
-            cursor.execute(
-                (
-                    "INSERT INTO accounts "
-                    "(id, name, base_currency, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?)"
-                ),
-                ("U7654321", "Account 2", "USD", now, now),
-            )
-
         account = Account.find_by(test_db, base_currency="USD")
         assert account is not None
         assert account.base_currency == "USD"
@@ -329,42 +235,10 @@ class TestAccountQueries:
 
     def test_where_returns_list_of_accounts(self, test_db):
         """Test that where() returns list of matching Accounts."""
-        # Create schema and test data
-        with test_db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    base_currency TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """
-            )
-            now = datetime.utcnow().isoformat()
-            cursor.execute(
-                (
-                    "INSERT INTO accounts "
-                    "(id, name, base_currency, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?)"
-                ),
-                ("U1234567", "Account 1", "USD", now, now),
-            )
-            cursor.execute(
-                (
-                    "INSERT INTO accounts "
-                    "(id, name, base_currency, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?)"
-                ),
-                ("U7654321", "Account 2", "USD", now, now),
-            )
-
         accounts = Account.where(test_db, base_currency="USD")
         assert len(accounts) == 2
         assert all(isinstance(acc, Account) for acc in accounts)
-        assert all(acc.base_currency == "USD" for acc in accounts)
+        assert [acc.base_currency for acc in accounts] == ["USD", "USD"]
 
         # Empty list if no matches
         accounts = Account.where(test_db, base_currency="EUR")
@@ -372,38 +246,6 @@ class TestAccountQueries:
 
     def test_all_returns_all_accounts(self, test_db):
         """Test that all() returns all Account records."""
-        # Create schema and test data
-        with test_db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    base_currency TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """
-            )
-            now = datetime.utcnow().isoformat()
-            cursor.execute(
-                (
-                    "INSERT INTO accounts "
-                    "(id, name, base_currency, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?)"
-                ),
-                ("U1234567", "Account 1", "USD", now, now),
-            )
-            cursor.execute(
-                (
-                    "INSERT INTO accounts "
-                    "(id, name, base_currency, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?)"
-                ),
-                ("U7654321", "Account 2", "USD", now, now),
-            )
-
         accounts = Account.all(test_db)
         assert len(accounts) == 2
         assert all(isinstance(acc, Account) for acc in accounts)
@@ -412,41 +254,20 @@ class TestAccountQueries:
 class TestAccountDelete:
     """Test Account delete() method."""
 
-    def test_delete_removes_account(self, test_db):
+    def test_delete_removes_account(self, test_db, seed_one_account):
         """Test that delete() removes account from database."""
-        # Create schema and test data
-        with test_db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    base_currency TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """
-            )
-            now = datetime.utcnow().isoformat()
-            cursor.execute(
-                (
-                    "INSERT INTO accounts "
-                    "(id, name, base_currency, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?)"
-                ),
-                ("U1234567", "Test Account", "USD", now, now),
-            )
-
         account = Account.find_by_id(test_db, "U1234567")
         assert account is not None
 
         result = account.delete()
         assert result is True
 
-        # Verify deletion
-        deleted = Account.find_by_id(test_db, "U1234567")
-        assert deleted is None
+        # Verify deletion (existence check only, no model hydration)
+        with test_db.connection() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM accounts WHERE id = ?", ("U1234567",)
+            ).fetchone()
+        assert row is None
 
     def test_delete_raises_error_without_id(self, test_db):
         """Test that delete() raises error when id is not set."""
@@ -10,6 +10,7 @@ from src.models.account import Account
 from src.models.active_model import ActiveModelError
 from src.models.position import Position
 from src.models.symbol import Symbol
+from tests.fixtures.seed import bulk_seed
 
 # Import the actual exception type that will be raised
 try:
@@ -18,105 +19,236 @@ except ImportError:
     import sqlite3
 
 
-def create_accounts_table(test_db):
-    """Helper to create accounts table schema for tests."""
-    with test_db.connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS accounts (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                base_currency TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                CHECK (base_currency = 'USD')
-            )
-        """
-        )
+_ACCOUNTS_DDL = """
+    CREATE TABLE accounts (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        base_currency TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        CHECK (base_currency = 'USD')
+    )
+"""
 
+_SYMBOLS_DDL = """
+    CREATE TABLE symbols (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        conid INTEGER UNIQUE NOT NULL,
+        symbol TEXT NOT NULL,
+        sec_type TEXT NOT NULL,
+        currency TEXT NOT NULL,
+        exchange TEXT,
+        name TEXT,
+        multiplier REAL,
+        expiry TEXT,
+        strike REAL,
+        right TEXT,
+        underlying_conid INTEGER,
+        local_symbol TEXT,
+        primary_exchange TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        CHECK (currency = 'USD')
+    )
+"""
+
+_POSITIONS_DDL = """
+    CREATE TABLE positions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        account_id TEXT NOT NULL,
+        symbol_id INTEGER NOT NULL,
+        quantity REAL NOT NULL,
+        market_price INTEGER,
+        market_value INTEGER,
+        avg_cost INTEGER,
+        currency TEXT NOT NULL,
+        unrealized_pnl INTEGER,
+        realized_pnl INTEGER,
+        snapshot_ts TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        CHECK (currency = 'USD'),
+        UNIQUE (account_id, symbol_id, snapshot_ts),
+        FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE,
+        FOREIGN KEY (symbol_id) REFERENCES symbols(id) ON DELETE RESTRICT
+    )
+"""
 
-def create_symbols_table(test_db):
-    """Helper to create symbols table schema for tests."""
+pytestmark = pytest.mark.usefixtures("schema", "db_savepoint")
+
+# Marks a field that is left out of the otherwise valid Position kwargs
+_MISSING = object()
+
+# (field, value replacing the valid one, expected error) for validate()
+VALIDATION_CASES = [
+    pytest.param("account_id", _MISSING, "account_id is required", id="account_id"),
+    pytest.param("symbol_id", _MISSING, "symbol_id is required", id="symbol_id"),
+    pytest.param("quantity", _MISSING, "quantity is required", id="quantity"),
+    pytest.param("currency", _MISSING, "currency is required", id="currency"),
+    pytest.param("snapshot_ts", _MISSING, "snapshot_ts is required", id="snapshot_ts"),
+    pytest.param("currency", "EUR", "Currency must be USD", id="currency_usd"),
+    pytest.param(
+        "account_id",
+        "NONEXISTENT",
+        "Account NONEXISTENT does not exist",
+        id="account_exists",
+    ),
+    pytest.param("symbol_id", 99999, "Symbol 99999 does not exist", id="symbol_exists"),
+    pytest.param(
+        "quantity", "not a number", "quantity must be numeric", id="quantity_numeric"
+    ),
+    pytest.param(
+        "snapshot_ts",
+        "invalid date",
+        "snapshot_ts must be valid ISO-8601",
+        id="iso8601_snapshot_ts",
+    ),
+    pytest.param(
+        "market_price",
+        150.25,  # Should be integer, not float
+        "market_price must be INTEGER",
+        id="currency_amounts_integer",
+    ),
+]
+
+
+# (create_from_api_data kwargs, expected Symbol fields, whether a Symbol is created)
+API_CASES = [
+    pytest.param(
+        {"conid": 272093, "symbol": "MSFT", "sec_type": "STK", "quantity": 100.0},
+        {"symbol": "MSFT", "sec_type": "STK", "currency": "USD"},
+        True,
+        id="creates_symbol_if_missing",
+    ),
+    pytest.param(
+        {"conid": 265598, "symbol": "AAPL", "sec_type": "STK", "quantity": 100.0},
+        {"symbol": "AAPL"},
+        False,
+        id="uses_existing_symbol",
+    ),
+    pytest.param(
+        {
+            "conid": 5000000,  # Option on the shared AAPL symbol
+            "symbol": "AAPL",
+            "sec_type": "OPT",
+            "quantity": 10.0,  # 10 contracts
+            "expiry": "2025-03-21",
+            "strike": 150.0,
+            "right": "C",
+            "underlying_conid": 265598,
+        },
+        {
+            "sec_type": "OPT",
+            "expiry": "2025-03-21",
+            "strike": 150.0,
+            "right": "C",
+            "underlying_conid": 265598,
+        },
+        True,
+        id="options_symbol",
+    ),
+    pytest.param(
+        {
+            "conid": 272093,
+            "symbol": "MSFT",
+            "sec_type": "STK",
+            "quantity": 100.0,
+            "symbol_name": "Microsoft Corporation",
+            "exchange": "NASDAQ",
+            "primary_exchange": "NASDAQ",
+            "local_symbol": "MSFT",
+        },
+        {
+            "name": "Microsoft Corporation",
+            "exchange": "NASDAQ",
+            "primary_exchange": "NASDAQ",
+            "local_symbol": "MSFT",
+        },
+        True,
+        id="optional_symbol_fields",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def schema(test_db):
+    """Create the accounts, symbols and positions tables once for the module."""
     with test_db.connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS symbols (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                conid INTEGER UNIQUE NOT NULL,
-                symbol TEXT NOT NULL,
-                sec_type TEXT NOT NULL,
-                currency TEXT NOT NULL,
-                exchange TEXT,
-                name TEXT,
-                multiplier REAL,
-                expiry TEXT,
-                strike REAL,
-                right TEXT,
-                underlying_conid INTEGER,
-                local_symbol TEXT,
-                primary_exchange TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                CHECK (currency = 'USD')
-            )
-        """
+        conn.executescript(";".join((_ACCOUNTS_DDL, _SYMBOLS_DDL, _POSITIONS_DDL)))
+    yield
+    with test_db.connection() as conn:
+        conn.executescript(
+            "DROP TABLE positions; DROP TABLE symbols; DROP TABLE accounts;"
         )
 
 
-def create_positions_table(test_db):
-    """Helper to create positions table schema for tests."""
+@pytest.fixture(scope="module")
+def seeded(test_db, schema):
+    """Seed Account U1234567 and AAPL (conid 265598) once for the module."""
+    bulk_seed(
+        test_db,
+        accounts=[("U1234567", "Test Account", "USD")],
+        symbols=[(265598, "AAPL", "STK", "USD")],
+    )
+
+
+@pytest.fixture(scope="module")
+def account(test_db, seeded):
+    """Account U1234567, shared by the whole module."""
+    return Account.find_by_id(test_db, "U1234567")
+
+
+@pytest.fixture(scope="module")
+def symbol(test_db, seeded):
+    """AAPL stock Symbol (conid 265598), shared by the whole module."""
+    return Symbol.find_by_conid(test_db, 265598)
+
+
+@pytest.fixture(scope="class")
+def query_world(test_db, account, symbol):
+    """Positions shared read-only by TestPositionQueries.
+
+    U1234567 holds two AAPL snapshots and one MSFT snapshot; U7654321 holds
+    one AAPL snapshot. Everything is rolled back when the class finishes.
+    """
     with test_db.connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS positions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                account_id TEXT NOT NULL,
-                symbol_id INTEGER NOT NULL,
-                quantity REAL NOT NULL,
-                market_price INTEGER,
-                market_value INTEGER,
-                avg_cost INTEGER,
-                currency TEXT NOT NULL,
-                unrealized_pnl INTEGER,
-                realized_pnl INTEGER,
-                snapshot_ts TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                CHECK (currency = 'USD'),
-                UNIQUE (account_id, symbol_id, snapshot_ts),
-                FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE,
-                FOREIGN KEY (symbol_id) REFERENCES symbols(id) ON DELETE RESTRICT
+        conn.execute("SAVEPOINT query_world")
+        bulk_seed(
+            test_db,
+            accounts=[("U7654321", "Account 2", "USD")],
+            symbols=[(272093, "MSFT", "STK", "USD")],
+        )
+        msft = Symbol.find_by_conid(test_db, 272093)
+        rows = {
+            "aapl_old": ("U1234567", symbol.id, 100.0, "2025-01-01T00:00:00Z"),
+            "aapl_new": ("U1234567", symbol.id, 150.0, "2025-01-02T00:00:00Z"),
+            "msft": ("U1234567", msft.id, 50.0, "2025-01-01T00:00:00Z"),
+            "other_account": ("U7654321", symbol.id, 50.0, "2025-01-01T00:00:00Z"),
+        }
+        keys = ("account_id", "symbol_id", "quantity", "snapshot_ts")
+        Position.bulk_save(
+            test_db,
+            [
+                Position(database=test_db, currency="USD", **dict(zip(keys, row)))
+                for row in rows.values()
+            ],
+        )
+        # bulk_save() does not set ids; read each row back by its unique key
+        yield {
+            key: Position.find_by(
+                test_db, account_id=row[0], symbol_id=row[1], snapshot_ts=row[3]
             )
-        """
-        )
+            for key, row in rows.items()
+        }
+        conn.execute("ROLLBACK TO SAVEPOINT query_world")
+        conn.execute("RELEASE SAVEPOINT query_world")
 
 
 class TestPositionFieldValidation:
     """Test Position field name validation."""
 
-    def test_position_rejects_invalid_fields(self, test_db):
+    def test_position_rejects_invalid_fields(self, test_db, account, symbol):
         """Test that Position rejects invalid field names in __init__."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        # Create account and symbol first
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
         with pytest.raises(ValueError, match="Invalid fields"):
             Position(
                 database=test_db,
@@ -128,27 +260,8 @@ class TestPositionFieldValidation:
                 invalid_field="should fail",  # Not in schema
             )
 
-    def test_position_accepts_all_valid_fields(self, test_db):
+    def test_position_accepts_all_valid_fields(self, test_db, account, symbol):
         """Test that Position accepts all valid fields."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        # Create account and symbol first
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
         position = Position(
             database=test_db,
             account_id="U1234567",
@@ -177,341 +290,34 @@ class TestPositionFieldValidation:
 class TestPositionValidation:
     """Test Position business rule validation."""
 
-    def test_validate_requires_account_id(self, test_db):
-        """Test that account_id is required."""
-        create_symbols_table(test_db)
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-
-        with pytest.raises(ActiveModelError, match="account_id is required"):
-            position.validate()
-
-    def test_validate_requires_symbol_id(self, test_db):
-        """Test that symbol_id is required."""
-        create_accounts_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-
-        with pytest.raises(ActiveModelError, match="symbol_id is required"):
-            position.validate()
-
-    def test_validate_requires_quantity(self, test_db):
-        """Test that quantity is required."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-
-        with pytest.raises(ActiveModelError, match="quantity is required"):
-            position.validate()
-
-    def test_validate_requires_currency(self, test_db):
-        """Test that currency is required."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-
-        with pytest.raises(ActiveModelError, match="currency is required"):
-            position.validate()
-
-    def test_validate_requires_snapshot_ts(self, test_db):
-        """Test that snapshot_ts is required."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="USD",
-        )
-
-        with pytest.raises(ActiveModelError, match="snapshot_ts is required"):
-            position.validate()
-
-    def test_validate_requires_currency_usd(self, test_db):
-        """Test that currency must be USD in Phase 1."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="EUR",  # Invalid
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-
-        with pytest.raises(ActiveModelError, match="Currency must be USD"):
-            position.validate()
-
-    def test_validate_requires_account_exists(self, test_db):
-        """Test that account must exist in database."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="NONEXISTENT",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-
-        with pytest.raises(
-            ActiveModelError, match="Account NONEXISTENT does not exist"
-        ):
-            position.validate()
-
-    def test_validate_requires_symbol_exists(self, test_db):
-        """Test that symbol must exist in database."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=99999,  # Non-existent symbol
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-
-        with pytest.raises(ActiveModelError, match="Symbol 99999 does not exist"):
-            position.validate()
-
-    def test_validate_requires_quantity_numeric(self, test_db):
-        """Test that quantity must be numeric."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity="not a number",  # Invalid
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-
-        with pytest.raises(ActiveModelError, match="quantity must be numeric"):
-            position.validate()
-
-    def test_validate_requires_valid_iso8601_snapshot_ts(self, test_db):
-        """Test that snapshot_ts must be valid ISO-8601 format."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="invalid date",  # Invalid
-        )
-
-        with pytest.raises(
-            ActiveModelError, match="snapshot_ts must be valid ISO-8601"
-        ):
-            position.validate()
-
-    def test_validate_requires_currency_amounts_integer(self, test_db):
-        """Test that currency amounts must be integers (micro-dollars)."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-            market_price=150.25,  # Should be integer, not float
-        )
-
-        with pytest.raises(ActiveModelError, match="market_price must be INTEGER"):
+    @pytest.mark.parametrize("field, bad_value, message", VALIDATION_CASES)
+    def test_validate_rejects_invalid_field(
+        self, test_db, account, symbol, field, bad_value, message
+    ):
+        """Test that validate() rejects a missing or invalid field value."""
+        fields = {
+            "account_id": "U1234567",
+            "symbol_id": symbol.id,
+            "quantity": 100.0,
+            "currency": "USD",
+            "snapshot_ts": "2025-01-01T00:00:00Z",
+        }
+        if bad_value is _MISSING:
+            del fields[field]
+        else:
+            fields[field] = bad_value
+
+        position = Position(database=test_db, **fields)
+
+        with pytest.raises(ActiveModelError, match=message):
             position.validate()
 
 
 class TestPositionSave:
     """Test Position save operations."""
 
-    def test_save_creates_new_position(self, test_db):
+    def test_save_creates_new_position(self, test_db, account, symbol):
         """Test that save() creates a new position."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
         position = Position(
             database=test_db,
             account_id="U1234567",
@@ -531,28 +337,10 @@ class TestPositionSave:
         assert loaded is not None
         assert loaded.account_id == "U1234567"
         assert loaded.symbol_id == symbol.id
-        assert loaded.quantity == 100.0
-
-    def test_save_updates_existing_position(self, test_db):
-        """Test that save() updates an existing position."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
+        assert loaded.quantity == 100.0
 
+    def test_save_updates_existing_position(self, test_db, account, symbol):
+        """Test that save() updates an existing position."""
         position = Position(
             database=test_db,
             account_id="U1234567",
@@ -567,33 +355,34 @@ class TestPositionSave:
         position.quantity = 150.0
         position.save()
 
-        # Verify update
-        loaded = Position.find_by_id(test_db, position.id)
-        assert loaded.quantity == 150.0
-
-    def test_save_enforces_unique_constraint(self, test_db):
-        """Test that save() enforces unique constraint.
-
-        Tests the unique constraint on (account_id, symbol_id, snapshot_ts).
-        """
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
+        # Verify update: drop the in-memory value, then re-read the stored row
+        position.quantity = None
+        assert position.reload().quantity == 150.0
+
+    def test_positions_table_enforces_unique_snapshot(self):
+        """Test the UNIQUE (account_id, symbol_id, snapshot_ts) constraint alone."""
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute(_POSITIONS_DDL)
+            insert = (
+                "INSERT INTO positions (account_id, symbol_id, quantity, currency, "
+                "snapshot_ts, created_at, updated_at) VALUES (?, ?, ?, 'USD', ?, ?, ?)"
+            )
+            ts = "2025-01-01T00:00:00Z"
+            conn.execute(insert, ("U1234567", 1, 100.0, ts, ts, ts))
 
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
+            with pytest.raises(sqlite3.IntegrityError):
+                conn.execute(insert, ("U1234567", 1, 200.0, ts, ts, ts))
+        finally:
+            conn.close()
 
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
+    @pytest.mark.integration
+    def test_save_enforces_unique_constraint(self, test_db, account, symbol):
+        """Test that save() surfaces the unique constraint end to end.
 
+        Tests the unique constraint on (account_id, symbol_id, snapshot_ts)
+        through the full Position model stack.
+        """
         # Create first position
         position1 = Position(
             database=test_db,
@@ -621,219 +410,36 @@ class TestPositionSave:
 
 
 class TestPositionQueries:
-    """Test Position query methods."""
+    """Test Position query methods (read-only against query_world)."""
 
-    def test_find_by_id(self, test_db):
+    def test_find_by_id(self, test_db, query_world):
         """Test finding position by ID."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-        position.save()
+        position = query_world["aapl_old"]
 
         loaded = Position.find_by_id(test_db, position.id)
         assert loaded is not None
         assert loaded.id == position.id
         assert loaded.account_id == "U1234567"
 
-    def test_find_by_account(self, test_db):
+    def test_find_by_account(self, test_db, query_world):
         """Test finding positions by account."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account1 = Account(
-            database=test_db, id="U1234567", name="Account 1", base_currency="USD"
-        )
-        account1.save()
-
-        account2 = Account(
-            database=test_db, id="U7654321", name="Account 2", base_currency="USD"
-        )
-        account2.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        # Create positions for account1
-        position1 = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-        position1.save()
-
-        position2 = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=200.0,
-            currency="USD",
-            snapshot_ts="2025-01-02T00:00:00Z",
-        )
-        position2.save()
-
-        # Create position for account2
-        position3 = Position(
-            database=test_db,
-            account_id="U7654321",
-            symbol_id=symbol.id,
-            quantity=50.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-        position3.save()
-
-        # Find positions for account1
         positions = Position.find_by_account(test_db, "U1234567")
-        assert len(positions) == 2
+        assert len(positions) == 3
         assert all(p.account_id == "U1234567" for p in positions)
 
-    def test_find_by_account_and_symbol(self, test_db):
+    def test_find_by_account_and_symbol(self, test_db, symbol, query_world):
         """Test finding positions by account and symbol."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol1 = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol1.save()
-
-        symbol2 = Symbol(
-            database=test_db,
-            conid=272093,
-            symbol="MSFT",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol2.save()
-
-        # Create positions for symbol1
-        position1 = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol1.id,
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-        position1.save()
-
-        position2 = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol1.id,
-            quantity=150.0,
-            currency="USD",
-            snapshot_ts="2025-01-02T00:00:00Z",
-        )
-        position2.save()
-
-        # Create position for symbol2
-        position3 = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol2.id,
-            quantity=50.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-        position3.save()
-
-        # Find positions for account and symbol1
-        positions = Position.find_by_account_and_symbol(test_db, "U1234567", symbol1.id)
+        positions = Position.find_by_account_and_symbol(test_db, "U1234567", symbol.id)
         assert len(positions) == 2
-        assert all(p.symbol_id == symbol1.id for p in positions)
+        assert all(p.symbol_id == symbol.id for p in positions)
 
-    def test_find_latest_by_account_and_symbol(self, test_db):
+    def test_find_latest_by_account_and_symbol(self, test_db, symbol, query_world):
         """Test finding latest position snapshot."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        # Create older position
-        position1 = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-        position1.save()
-
-        # Create newer position
-        position2 = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=150.0,
-            currency="USD",
-            snapshot_ts="2025-01-02T00:00:00Z",
-        )
-        position2.save()
-
-        # Find latest
         latest = Position.find_latest_by_account_and_symbol(
             test_db, "U1234567", symbol.id
         )
         assert latest is not None
-        assert latest.id == position2.id
+        assert latest.id == query_world["aapl_new"].id
         assert latest.quantity == 150.0
         assert latest.snapshot_ts == "2025-01-02T00:00:00Z"
 
@@ -841,183 +447,38 @@ class TestPositionQueries:
 class TestPositionAutomaticSymbolCreation:
     """Test automatic Symbol creation from API data."""
 
-    def test_create_from_api_data_creates_symbol_if_missing(self, test_db):
-        """Test that create_from_api_data creates Symbol if it doesn't exist."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        # Symbol doesn't exist yet
-        assert Symbol.find_by_conid(test_db, 265598) is None
-
-        # Create position from API data - should auto-create Symbol
-        position = Position.create_from_api_data(
-            database=test_db,
-            account_id="U1234567",
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            quantity=100.0,
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-
-        # Verify Symbol was created
-        symbol = Symbol.find_by_conid(test_db, 265598)
-        assert symbol is not None
-        assert symbol.symbol == "AAPL"
-        assert symbol.sec_type == "STK"
-        assert symbol.currency == "USD"
-
-        # Verify Position was created
-        assert position is not None
-        assert position.account_id == "U1234567"
-        assert position.symbol_id == symbol.id
-        assert position.quantity == 100.0
-
-    def test_create_from_api_data_uses_existing_symbol(self, test_db):
-        """Test that create_from_api_data uses existing Symbol if it exists."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        # Create Symbol first
-        existing_symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-            name="Apple Inc.",
-        )
-        existing_symbol.save()
-        symbol_id = existing_symbol.id
+    @pytest.mark.parametrize("api_kwargs, expected_symbol, creates_symbol", API_CASES)
+    def test_create_from_api_data_resolves_symbol(
+        self, test_db, account, symbol, api_kwargs, expected_symbol, creates_symbol
+    ):
+        """Test that create_from_api_data creates a missing Symbol or reuses one."""
+        conid = api_kwargs["conid"]
+        # The shared AAPL symbol exists; every other conid must be created
+        assert (Symbol.find_by_conid(test_db, conid) is None) is creates_symbol
 
-        # Create position from API data - should use existing Symbol
         position = Position.create_from_api_data(
             database=test_db,
             account_id="U1234567",
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            quantity=100.0,
             snapshot_ts="2025-01-01T00:00:00Z",
+            **api_kwargs,
         )
 
-        # Verify it used the existing Symbol
-        assert position.symbol_id == symbol_id
-
-        # Verify only one Symbol exists
-        symbols = Symbol.where(test_db, conid=265598)
+        # Verify exactly one Symbol with the expected fields
+        symbols = Symbol.where(test_db, conid=conid)
         assert len(symbols) == 1
-
-    def test_create_from_api_data_with_options_symbol(self, test_db):
-        """Test automatic Symbol creation for options positions."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        # Create underlying stock Symbol first
-        underlying = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        underlying.save()
-
-        # Create position from API data for option - should auto-create option Symbol
-        position = Position.create_from_api_data(
-            database=test_db,
-            account_id="U1234567",
-            conid=5000000,  # Option conid
-            symbol="AAPL",
-            sec_type="OPT",
-            quantity=10.0,  # 10 contracts
-            snapshot_ts="2025-01-01T00:00:00Z",
-            expiry="2025-03-21",
-            strike=150.0,
-            right="C",
-            underlying_conid=265598,
-        )
-
-        # Verify option Symbol was created
-        option_symbol = Symbol.find_by_conid(test_db, 5000000)
-        assert option_symbol is not None
-        assert option_symbol.sec_type == "OPT"
-        assert option_symbol.expiry == "2025-03-21"
-        assert option_symbol.strike == 150.0
-        assert option_symbol.right == "C"
-        assert option_symbol.underlying_conid == 265598
-
-        # Verify Position was created
-        assert position.symbol_id == option_symbol.id
-        assert position.quantity == 10.0
-
-    def test_create_from_api_data_with_optional_symbol_fields(self, test_db):
-        """Test automatic Symbol creation with optional fields."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        # Create position with all optional Symbol fields
-        position = Position.create_from_api_data(
-            database=test_db,
-            account_id="U1234567",
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            quantity=100.0,
-            snapshot_ts="2025-01-01T00:00:00Z",
-            symbol_name="Apple Inc.",
-            exchange="NASDAQ",
-            primary_exchange="NASDAQ",
-            local_symbol="AAPL",
-        )
-
-        # Verify Symbol was created with all fields
-        symbol = Symbol.find_by_conid(test_db, 265598)
-        assert symbol is not None
-        assert symbol.name == "Apple Inc."
-        assert symbol.exchange == "NASDAQ"
-        assert symbol.primary_exchange == "NASDAQ"
-        assert symbol.local_symbol == "AAPL"
+        resolved = symbols[0]
+        for field, value in expected_symbol.items():
+            assert getattr(resolved, field) == value
+        if not creates_symbol:
+            assert resolved.id == symbol.id
 
         # Verify Position was created
-        assert position is not None
-        assert position.symbol_id == symbol.id
+        assert position.account_id == "U1234567"
+        assert position.symbol_id == resolved.id
+        assert position.quantity == api_kwargs["quantity"]
 
-    def test_create_from_api_data_with_currency_amounts(self, test_db):
+    def test_create_from_api_data_with_currency_amounts(self, test_db, account):
         """Test create_from_api_data with currency amounts in micro-dollars."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
         position = Position.create_from_api_data(
             database=test_db,
             account_id="U1234567",
@@ -1041,10 +502,6 @@ class TestPositionAutomaticSymbolCreation:
 
     def test_create_from_api_data_raises_if_account_not_found(self, test_db):
         """Test that create_from_api_data raises if account doesn't exist."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
         with pytest.raises(ValueError, match="Account NONEXISTENT does not exist"):
             Position.create_from_api_data(
                 database=test_db,
@@ -1060,35 +517,11 @@ class TestPositionAutomaticSymbolCreation:
 class TestPositionDelete:
     """Test Position delete operations."""
 
-    def test_delete_removes_position(self, test_db):
+    def test_delete_removes_position(self, test_db, account, symbol):
         """Test that delete() removes position from database."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        position = Position(
-            database=test_db,
-            account_id="U1234567",
-            symbol_id=symbol.id,
-            quantity=100.0,
-            currency="USD",
-            snapshot_ts="2025-01-01T00:00:00Z",
-        )
-        position.save()
+        ts = "2025-01-01T00:00:00Z"
+        bulk_seed(test_db, positions=[("U1234567", symbol.id, 100.0, "USD", ts)])
+        position = Position.find_by(test_db, account_id="U1234567", snapshot_ts=ts)
 
         position_id = position.id
 
@@ -1097,28 +530,10 @@ class TestPositionDelete:
         assert result is True
 
         # Verify it's gone
-        loaded = Position.find_by_id(test_db, position_id)
-        assert loaded is None
+        assert Position.pluck(test_db, "id", id=position_id) == []
 
-    def test_delete_raises_if_no_id(self, test_db):
+    def test_delete_raises_if_no_id(self, test_db, account, symbol):
         """Test that delete() raises if position has no ID."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
         position = Position(
             database=test_db,
             account_id="U1234567",
@@ -1136,26 +551,8 @@ class TestPositionDelete:
 class TestPositionRepr:
     """Test Position string representation."""
 
-    def test_repr_with_id(self, test_db):
+    def test_repr_with_id(self, test_db, account, symbol):
         """Test __repr__ with ID."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-        create_positions_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
         position = Position(
             database=test_db,
             account_id="U1234567",
@@ -1173,25 +570,8 @@ class TestPositionRepr:
         assert str(symbol.id) in repr_str
         assert "100.0" in repr_str
 
-    def test_repr_without_id(self, test_db):
+    def test_repr_without_id(self, test_db, account, symbol):
         """Test __repr__ without ID (unsaved)."""
-        create_accounts_table(test_db)
-        create_symbols_table(test_db)
-
-        account = Account(
-            database=test_db, id="U1234567", name="Test Account", base_currency="USD"
-        )
-        account.save()
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
         position = Position(
             database=test_db,
             account_id="U1234567",
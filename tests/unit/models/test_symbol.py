@@ -5,46 +5,54 @@ Tests the Symbol model's validation, persistence, and query methods.
 
 import pytest
 
-from src.models.symbol import Symbol
 from src.models.active_model import ActiveModelError
+from src.models.symbol import Symbol
+from tests.fixtures.seed import bulk_seed
+
+_SYMBOLS_DDL = """
+    CREATE TABLE symbols (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        conid INTEGER UNIQUE NOT NULL,
+        symbol TEXT NOT NULL,
+        sec_type TEXT NOT NULL,
+        currency TEXT NOT NULL,
+        exchange TEXT,
+        name TEXT,
+        multiplier REAL,
+        expiry TEXT,
+        strike REAL,
+        right TEXT,
+        underlying_conid INTEGER,
+        local_symbol TEXT,
+        primary_exchange TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+"""
 
+# Only the classes that touch the database request these; validation runs on
+# unsaved instances with no database at all
+uses_db = pytest.mark.usefixtures("schema", "db_savepoint")
 
-def create_symbols_table(test_db):
-    """Helper to create symbols table schema for tests."""
+
+@pytest.fixture(scope="module")
+def schema(test_db):
+    """Create the symbols table once for the module."""
     with test_db.connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS symbols (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                conid INTEGER UNIQUE NOT NULL,
-                symbol TEXT NOT NULL,
-                sec_type TEXT NOT NULL,
-                currency TEXT NOT NULL,
-                exchange TEXT,
-                name TEXT,
-                multiplier REAL,
-                expiry TEXT,
-                strike REAL,
-                right TEXT,
-                underlying_conid INTEGER,
-                local_symbol TEXT,
-                primary_exchange TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """
-        )
+        conn.execute(_SYMBOLS_DDL)
+    yield
+    with test_db.connection() as conn:
+        conn.execute("DROP TABLE symbols")
 
 
 class TestSymbolFieldValidation:
     """Test Symbol field name validation."""
 
-    def test_symbol_rejects_invalid_fields(self, test_db):
+    def test_symbol_rejects_invalid_fields(self):
         """Test that Symbol rejects invalid field names in __init__."""
         with pytest.raises(ValueError, match="Invalid fields"):
             Symbol(
-                database=test_db,
+                database=None,
                 conid=265598,
                 symbol="AAPL",
                 sec_type="STK",
@@ -52,10 +60,10 @@ class TestSymbolFieldValidation:
                 invalid_field="should fail",  # Not in schema
             )
 
-    def test_symbol_accepts_all_valid_fields(self, test_db):
+    def test_symbol_accepts_all_valid_fields(self):
         """Test that Symbol accepts all valid fields."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=265598,
             symbol="AAPL",
             sec_type="STK",
@@ -77,54 +85,58 @@ class TestSymbolFieldValidation:
 class TestSymbolValidation:
     """Test Symbol business rule validation."""
 
-    def test_validate_requires_conid(self, test_db):
+    def test_validate_requires_conid(self):
         """Test that conid is required."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             symbol="AAPL",
             sec_type="STK",
             currency="USD",
         )
-        with pytest.raises(ActiveModelError, match="conid is required"):
+        with pytest.raises(ActiveModelError) as exc_info:
             symbol.validate()
+        assert "conid is required for Symbol" in exc_info.value.errors
 
-    def test_validate_requires_symbol(self, test_db):
+    def test_validate_requires_symbol(self):
         """Test that symbol ticker is required."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=265598,
             sec_type="STK",
             currency="USD",
         )
-        with pytest.raises(ActiveModelError, match="symbol is required"):
+        with pytest.raises(ActiveModelError) as exc_info:
             symbol.validate()
+        assert "symbol is required for Symbol" in exc_info.value.errors
 
-    def test_validate_requires_sec_type(self, test_db):
+    def test_validate_requires_sec_type(self):
         """Test that sec_type is required."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=265598,
             symbol="AAPL",
             currency="USD",
         )
-        with pytest.raises(ActiveModelError, match="sec_type is required"):
+        with pytest.raises(ActiveModelError) as exc_info:
             symbol.validate()
+        assert "sec_type is required for Symbol" in exc_info.value.errors
 
-    def test_validate_requires_currency(self, test_db):
+    def test_validate_requires_currency(self):
         """Test that currency is required."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=265598,
             symbol="AAPL",
             sec_type="STK",
         )
-        with pytest.raises(ActiveModelError, match="currency is required"):
+        with pytest.raises(ActiveModelError) as exc_info:
             symbol.validate()
+        assert "currency is required for Symbol" in exc_info.value.errors
 
-    def test_validate_currency_must_be_usd(self, test_db):
+    def test_validate_currency_must_be_usd(self):
         """Test that currency must be USD in Phase 1."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=265598,
             symbol="AAPL",
             sec_type="STK",
@@ -133,10 +145,10 @@ class TestSymbolValidation:
         with pytest.raises(ActiveModelError, match="Currency must be USD"):
             symbol.validate()
 
-    def test_validate_sec_type_must_be_valid(self, test_db):
+    def test_validate_sec_type_must_be_valid(self):
         """Test that sec_type must be one of valid types."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=265598,
             symbol="AAPL",
             sec_type="INVALID",
@@ -145,24 +157,25 @@ class TestSymbolValidation:
         with pytest.raises(ActiveModelError, match="sec_type must be one of"):
             symbol.validate()
 
-    def test_validate_accepts_valid_sec_types(self, test_db):
+    @pytest.mark.parametrize(
+        "sec_type", ["STK", "OPT", "FUT", "CASH", "BOND", "CFD", "FOP", "WAR", "IOPT"]
+    )
+    def test_validate_accepts_valid_sec_types(self, sec_type):
         """Test that all valid security types are accepted."""
-        valid_types = ["STK", "OPT", "FUT", "CASH", "BOND", "CFD", "FOP", "WAR", "IOPT"]
-        for sec_type in valid_types:
-            symbol = Symbol(
-                database=test_db,
-                conid=265598,
-                symbol="TEST",
-                sec_type=sec_type,
-                currency="USD",
-            )
-            # Should not raise
-            symbol.validate()
+        symbol = Symbol(
+            database=None,
+            conid=265598,
+            symbol="TEST",
+            sec_type=sec_type,
+            currency="USD",
+        )
+        # Should not raise
+        symbol.validate()
 
-    def test_validate_option_right_must_be_c_or_p(self, test_db):
+    def test_validate_option_right_must_be_c_or_p(self):
         """Test that option right must be 'C' or 'P'."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=123456,
             symbol="AAPL",
             sec_type="OPT",
@@ -172,26 +185,26 @@ class TestSymbolValidation:
         with pytest.raises(ActiveModelError, match="right must be 'C' or 'P'"):
             symbol.validate()
 
-    def test_validate_accepts_valid_option_rights(self, test_db):
+    @pytest.mark.parametrize("right", ["C", "P"])
+    def test_validate_accepts_valid_option_rights(self, right):
         """Test that valid option rights are accepted."""
-        for right in ["C", "P"]:
-            symbol = Symbol(
-                database=test_db,
-                conid=123456,
-                symbol="AAPL",
-                sec_type="OPT",
-                currency="USD",
-                right=right,
-                strike=150.0,
-                expiry="2024-12-20",
-            )
-            # Should not raise
-            symbol.validate()
+        symbol = Symbol(
+            database=None,
+            conid=123456,
+            symbol="AAPL",
+            sec_type="OPT",
+            currency="USD",
+            right=right,
+            strike=150.0,
+            expiry="2024-12-20",
+        )
+        # Should not raise
+        symbol.validate()
 
-    def test_validate_stock_symbol_passes(self, test_db):
+    def test_validate_stock_symbol_passes(self):
         """Test that a valid stock symbol passes validation."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=265598,
             symbol="AAPL",
             sec_type="STK",
@@ -200,23 +213,24 @@ class TestSymbolValidation:
         # Should not raise
         symbol.validate()
 
-    def test_validate_underlying_conid_must_be_integer(self, test_db):
+    def test_validate_underlying_conid_must_be_integer(self):
         """Test that underlying_conid must be an integer if provided."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=123456,
             symbol="AAPL",
             sec_type="OPT",
             currency="USD",
             underlying_conid="not-an-int",  # Invalid
         )
-        with pytest.raises(ActiveModelError, match="underlying_conid must be an integer"):
+        with pytest.raises(ActiveModelError) as exc_info:
             symbol.validate()
+        assert exc_info.value.errors == ["underlying_conid must be an integer"]
 
-    def test_validate_accepts_conid_zero(self, test_db):
+    def test_validate_accepts_conid_zero(self):
         """Test that conid=0 is valid (edge case)."""
         symbol = Symbol(
-            database=test_db,
+            database=None,
             conid=0,  # Valid integer, though unlikely in practice
             symbol="TEST",
             sec_type="STK",
@@ -226,13 +240,12 @@ class TestSymbolValidation:
         symbol.validate()
 
 
+@uses_db
 class TestSymbolSave:
     """Test Symbol save operations."""
 
     def test_save_new_symbol_creates_record(self, test_db):
         """Test that saving a new symbol creates a database record."""
-        create_symbols_table(test_db)
-
         symbol = Symbol(
             database=test_db,
             conid=265598,
@@ -254,8 +267,6 @@ class TestSymbolSave:
 
     def test_save_new_symbol_auto_increments_id(self, test_db):
         """Test that INTEGER PRIMARY KEY auto-increments."""
-        create_symbols_table(test_db)
-
         symbol1 = Symbol(
             database=test_db,
             conid=265598,
@@ -278,8 +289,6 @@ class TestSymbolSave:
 
     def test_save_updates_existing_symbol(self, test_db):
         """Test that saving an existing symbol updates it."""
-        create_symbols_table(test_db)
-
         # Create and save initial symbol
         symbol = Symbol(
             database=test_db,
@@ -302,8 +311,6 @@ class TestSymbolSave:
 
     def test_save_updates_existing_symbol_loaded_from_db(self, test_db):
         """Test that saving a symbol loaded from database updates it."""
-        create_symbols_table(test_db)
-
         # Create initial symbol
         symbol = Symbol(
             database=test_db,
@@ -329,10 +336,20 @@ class TestSymbolSave:
         assert updated.name == "Apple Inc."
         assert updated.exchange == "NASDAQ"
 
+    def test_symbols_table_rejects_duplicate_conid_batch(self, test_db):
+        """Test that one batched insert with a repeated conid fails as a whole."""
+        from src.database import SQLiteError
+
+        rows = [(265598, "AAPL", "STK", "USD"), (265598, "MSFT", "STK", "USD")]
+        with pytest.raises(SQLiteError):
+            bulk_seed(test_db, symbols=rows)
+
+        # The batch runs in one transaction, so the first row was not kept either
+        assert Symbol.all(test_db) == []
+
+    @pytest.mark.integration
     def test_save_rejects_duplicate_conid(self, test_db):
         """Test that saving a symbol with duplicate conid raises database error."""
-        create_symbols_table(test_db)
-
         # Create first symbol
         symbol1 = Symbol(
             database=test_db,
@@ -354,13 +371,12 @@ class TestSymbolSave:
 
         # Should raise database error due to UNIQUE constraint
         from src.database import SQLiteError
+
         with pytest.raises(SQLiteError):
             symbol2.save()
 
     def test_save_with_full_option_data(self, test_db):
         """Test saving a symbol with full option data."""
-        create_symbols_table(test_db)
-
         symbol = Symbol(
             database=test_db,
             conid=123456,
@@ -401,13 +417,12 @@ class TestSymbolSave:
             symbol.save()
 
 
+@uses_db
 class TestSymbolQueries:
     """Test Symbol query methods."""
 
     def test_find_by_id(self, test_db):
         """Test finding symbol by ID."""
-        create_symbols_table(test_db)
-
         symbol = Symbol(
             database=test_db,
             conid=265598,
@@ -424,23 +439,12 @@ class TestSymbolQueries:
 
     def test_find_by_id_returns_none_if_not_found(self, test_db):
         """Test that find_by_id returns None if not found."""
-        create_symbols_table(test_db)
-
         found = Symbol.find_by_id(test_db, 99999)
         assert found is None
 
     def test_find_by_conid(self, test_db):
         """Test finding symbol by IB contract ID."""
-        create_symbols_table(test_db)
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
+        bulk_seed(test_db, symbols=[(265598, "AAPL", "STK", "USD")])
 
         found = Symbol.find_by_conid(test_db, 265598)
         assert found is not None
@@ -448,23 +452,12 @@ class TestSymbolQueries:
 
     def test_find_by_conid_returns_none_if_not_found(self, test_db):
         """Test that find_by_conid returns None if not found."""
-        create_symbols_table(test_db)
-
         found = Symbol.find_by_conid(test_db, 99999)
         assert found is None
 
     def test_find_by_symbol(self, test_db):
         """Test finding symbol by ticker and security type."""
-        create_symbols_table(test_db)
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
+        bulk_seed(test_db, symbols=[(265598, "AAPL", "STK", "USD")])
 
         found = Symbol.find_by_symbol(test_db, "AAPL", "STK")
         assert found is not None
@@ -472,30 +465,11 @@ class TestSymbolQueries:
 
     def test_find_by_symbol_with_sec_type(self, test_db):
         """Test finding symbol by ticker with specific sec_type."""
-        create_symbols_table(test_db)
-
-        # Create stock
-        stock = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
+        # Create a stock and an option with the same symbol
+        bulk_seed(
+            test_db,
+            symbols=[(265598, "AAPL", "STK", "USD"), (123456, "AAPL", "OPT", "USD")],
         )
-        stock.save()
-
-        # Create option with same symbol
-        option = Symbol(
-            database=test_db,
-            conid=123456,
-            symbol="AAPL",
-            sec_type="OPT",
-            currency="USD",
-            strike=150.0,
-            expiry="2024-12-20",
-            right="C",
-        )
-        option.save()
 
         # Find stock
         found_stock = Symbol.find_by_symbol(test_db, "AAPL", "STK")
@@ -509,25 +483,10 @@ class TestSymbolQueries:
 
     def test_find_all(self, test_db):
         """Test finding all symbols."""
-        create_symbols_table(test_db)
-
-        symbol1 = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol1.save()
-
-        symbol2 = Symbol(
-            database=test_db,
-            conid=265599,
-            symbol="MSFT",
-            sec_type="STK",
-            currency="USD",
+        bulk_seed(
+            test_db,
+            symbols=[(265598, "AAPL", "STK", "USD"), (265599, "MSFT", "STK", "USD")],
         )
-        symbol2.save()
 
         all_symbols = Symbol.all(test_db)
         assert len(all_symbols) == 2
@@ -537,25 +496,10 @@ class TestSymbolQueries:
 
     def test_where(self, test_db):
         """Test where query method."""
-        create_symbols_table(test_db)
-
-        symbol1 = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
+        bulk_seed(
+            test_db,
+            symbols=[(265598, "AAPL", "STK", "USD"), (265599, "MSFT", "STK", "USD")],
         )
-        symbol1.save()
-
-        symbol2 = Symbol(
-            database=test_db,
-            conid=265599,
-            symbol="MSFT",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol2.save()
 
         # Query by sec_type
         stocks = Symbol.where(test_db, sec_type="STK")
@@ -567,13 +511,12 @@ class TestSymbolQueries:
         assert aapl[0].conid == 265598
 
 
+@uses_db
 class TestSymbolDelete:
     """Test Symbol delete operations."""
 
     def test_delete_symbol(self, test_db):
         """Test deleting a symbol."""
-        create_symbols_table(test_db)
-
         symbol = Symbol(
             database=test_db,
             conid=265598,
@@ -606,30 +549,13 @@ class TestSymbolDelete:
             symbol.delete()
 
 
+@uses_db
 class TestSymbolRepr:
     """Test Symbol string representation."""
 
-    def test_repr_with_id(self, test_db):
-        """Test __repr__ when symbol has ID."""
-        create_symbols_table(test_db)
-
-        symbol = Symbol(
-            database=test_db,
-            conid=265598,
-            symbol="AAPL",
-            sec_type="STK",
-            currency="USD",
-        )
-        symbol.save()
-
-        repr_str = repr(symbol)
-        assert "Symbol" in repr_str
-        assert "265598" in repr_str
-        assert "AAPL" in repr_str
-        assert "STK" in repr_str
-
-    def test_repr_without_id(self, test_db):
-        """Test __repr__ when symbol doesn't have ID yet."""
+    @pytest.mark.parametrize("save_it", [True, False], ids=["with_id", "without_id"])
+    def test_repr(self, test_db, save_it):
+        """Test __repr__ before and after the symbol gets an ID."""
         symbol = Symbol(
             database=test_db,
             conid=265598,
@@ -637,10 +563,11 @@ class TestSymbolRepr:
             sec_type="STK",
             currency="USD",
         )
+        if save_it:
+            symbol.save()
 
         repr_str = repr(symbol)
-        assert "Symbol" in repr_str
-        assert "265598" in repr_str
-        assert "AAPL" in repr_str
-        assert "STK" in repr_str
-
+        expected_prefix = f"Symbol(id={symbol.id}, " if save_it else "Symbol(conid="
+        assert repr_str.startswith(expected_prefix)
+        for token in ("265598", "AAPL", "STK"):
+            assert token in repr_str
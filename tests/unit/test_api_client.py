@@ -1,8 +1,10 @@
 """Unit tests for API client."""
 
+import json
+
 import pytest
 import requests
-import requests_mock
+from requests.adapters import HTTPAdapter
 
 from src.api_client import (
     APIError,
@@ -11,6 +13,50 @@ from src.api_client import (
     IBKRAPIClient,
     NetworkError,
 )
+from tests.fixtures.mock_gateway import StubAdapter
+from tests.fixtures.sample_responses import sample_tickle_response
+
+BASE_URL = "https://localhost:5001/v1/api"
+
+# {"status": "ok"} tickle reply, serialized once and reused by every OK response
+OK_RESPONSE = {
+    "content": json.dumps(sample_tickle_response()).encode(),
+    "headers": {"Content-Type": "application/json"},
+    "status_code": 200,
+}
+
+
+@pytest.fixture(scope="module")
+def _shared_client():
+    """One client (and requests.Session) for the whole module."""
+    client = IBKRAPIClient()
+    yield client
+    client.session.close()
+
+
+@pytest.fixture
+def client(_shared_client):
+    """Shared client pointed at the default gateway, with per-test state reset."""
+    _shared_client.csrf_token = None
+    _shared_client.session.cookies.clear()
+    return _shared_client
+
+
+@pytest.fixture
+def gateway(client):
+    """Script the client's HTTPS responses with a StubAdapter for one test.
+
+    Call it with requests_mock-style response dicts; it returns the mounted
+    adapter, whose ``requests`` list records what the client sent.
+    """
+
+    def mount(*script):
+        adapter = StubAdapter(script)
+        client.session.mount("https://", adapter)
+        return adapter
+
+    yield mount
+    client.session.mount("https://", HTTPAdapter())
 
 
 class TestIBKRAPIClient:
@@ -35,153 +81,104 @@ class TestIBKRAPIClient:
         assert client.timeout == 60
         assert client.session.verify is True
 
-    def test_tickle_success(self):
+    def test_tickle_success(self, client, gateway):
         """Test successful tickle call."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                json={"status": "ok"},
-                status_code=200,
-            )
-            result = client.tickle()
-            assert result == {"status": "ok"}
-
-    def test_tickle_401_raises_authentication_error(self):
-        """Test tickle with 401 raises AuthenticationError."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                status_code=401,
-            )
-            with pytest.raises(AuthenticationError, match="Session expired"):
-                client.tickle()
-
-    def test_tickle_403_raises_authentication_error(self):
-        """Test tickle with 403 raises AuthenticationError."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                status_code=403,
-            )
-            with pytest.raises(AuthenticationError, match="Insufficient permissions"):
-                client.tickle()
-
-    def test_tickle_404_raises_client_error(self):
-        """Test tickle with 404 raises ClientError (non-retryable)."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                status_code=404,
-            )
-            with pytest.raises(ClientError, match="Endpoint not found"):
-                client.tickle()
-
-    def test_tickle_500_raises_api_error_retryable(self):
-        """Test tickle with 500 raises retryable APIError."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                status_code=500,
-            )
-            # Should raise APIError (retryable)
-            with pytest.raises(APIError, match="Server error"):
-                client.tickle()
-
-    def test_tickle_connection_error_raises_network_error(self):
+        adapter = gateway(OK_RESPONSE)
+        result = client.tickle()
+        assert result == {"status": "ok"}
+        assert adapter.requests[0].url == f"{BASE_URL}/tickle"
+
+    @pytest.mark.parametrize(
+        "status, error, message, attempts",
+        [
+            (401, AuthenticationError, "Session expired", 1),
+            (403, AuthenticationError, "Insufficient permissions", 1),
+            (404, ClientError, "Endpoint not found", 1),
+            (400, ClientError, "Client error 400", 1),
+            (402, ClientError, "Client error 402", 1),
+            # Server errors are retried until the 5-attempt limit
+            (500, APIError, "Server error", 5),
+        ],
+    )
+    def test_tickle_error_status_raises(
+        self, client, gateway, status, error, message, attempts
+    ):
+        """Test that each error status maps to its exception and retry count."""
+        adapter = gateway({"status_code": status})
+
+        with pytest.raises(error, match=message):
+            client.tickle()
+        # Only retryable errors (APIError) make more than one request
+        assert len(adapter.requests) == attempts
+
+    def test_tickle_connection_error_raises_network_error(self, client, requests_mock):
         """Test tickle with connection error raises NetworkError."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                exc=requests.exceptions.ConnectionError("Connection refused"),
-            )
-            with pytest.raises(NetworkError, match="Gateway not reachable"):
-                client.tickle()
-
-    def test_tickle_timeout_raises_network_error(self):
+        requests_mock.get(
+            f"{BASE_URL}/tickle",
+            exc=requests.exceptions.ConnectionError("Connection refused"),
+        )
+        with pytest.raises(NetworkError, match="Gateway not reachable"):
+            client.tickle()
+
+    def test_tickle_timeout_raises_network_error(self, client, requests_mock):
         """Test tickle with timeout raises NetworkError."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                exc=requests.exceptions.Timeout("Request timeout"),
-            )
-            with pytest.raises(NetworkError, match="Request timeout"):
-                client.tickle()
-
-    def test_tickle_invalid_json_raises_client_error(self):
-        """Test tickle with invalid JSON raises ClientError (non-retryable)."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                text="not json",
-                status_code=200,
-            )
-            with pytest.raises(ClientError, match="Invalid JSON response"):
-                client.tickle()
-
-    def test_csrf_token_extraction(self):
-        """Test CSRF token extraction from response headers."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                json={"status": "ok"},
-                status_code=200,
-                headers={"X-CSRF-TOKEN": "test-token-123"},
-            )
+        requests_mock.get(
+            f"{BASE_URL}/tickle",
+            exc=requests.exceptions.Timeout("Request timeout"),
+        )
+        with pytest.raises(NetworkError, match="Request timeout"):
             client.tickle()
-            assert client.csrf_token == "test-token-123"
 
-    def test_csrf_token_in_subsequent_requests(self):
-        """Test CSRF token is included in subsequent requests."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            # First request sets CSRF token
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                json={"status": "ok"},
-                status_code=200,
-                headers={"X-CSRF-TOKEN": "test-token-123"},
-            )
+    def test_tickle_invalid_json_raises_client_error(self, client, requests_mock):
+        """Test tickle with invalid JSON raises ClientError (non-retryable)."""
+        requests_mock.get(
+            f"{BASE_URL}/tickle",
+            text="not json",
+            status_code=200,
+        )
+        with pytest.raises(ClientError, match="Invalid JSON response"):
             client.tickle()
 
-            # Second request should include CSRF token
-            m.get(
-                "https://localhost:5001/v1/api/portfolio/accounts",
-                json=[],
-                status_code=200,
-            )
-            client.get_accounts()
+    def test_csrf_token_extracted_and_sent_on_subsequent_requests(
+        self, client, requests_mock
+    ):
+        """Test CSRF token is read from response headers and sent afterwards."""
+        # First request sets CSRF token
+        requests_mock.get(
+            f"{BASE_URL}/tickle",
+            content=OK_RESPONSE["content"],
+            status_code=200,
+            headers={**OK_RESPONSE["headers"], "X-CSRF-TOKEN": "test-token-123"},
+        )
+        client.tickle()
+        assert client.csrf_token == "test-token-123"
+        # The first request had no token to send yet
+        assert "X-CSRF-TOKEN" not in requests_mock.request_history[0].headers
+
+        # Second request should include CSRF token
+        requests_mock.get(
+            f"{BASE_URL}/portfolio/accounts",
+            json=[],
+            status_code=200,
+        )
+        client.get_accounts()
 
-            # Verify CSRF token was sent
-            last_request = m.request_history[-1]
-            assert last_request.headers.get("X-CSRF-TOKEN") == "test-token-123"
+        # Verify CSRF token was sent
+        last_request = requests_mock.request_history[-1]
+        assert last_request.headers.get("X-CSRF-TOKEN") == "test-token-123"
 
-    def test_get_accounts_success(self):
+    def test_get_accounts_success(self, client, gateway):
         """Test successful get_accounts call."""
-        client = IBKRAPIClient()
         expected_response = [
             {"accountId": "U1234567", "accountTitle": "Individual", "currency": "USD"}
         ]
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/portfolio/accounts",
-                json=expected_response,
-                status_code=200,
-            )
-            result = client.get_accounts()
-            assert result == expected_response
-
-    def test_get_positions_success(self):
+        adapter = gateway({"json": expected_response, "status_code": 200})
+        result = client.get_accounts()
+        assert result == expected_response
+        assert adapter.requests[0].url == f"{BASE_URL}/portfolio/accounts"
+
+    def test_get_positions_success(self, client, requests_mock):
         """Test successful get_positions call."""
-        client = IBKRAPIClient()
         expected_response = [
             {
                 "conid": 265598,
@@ -192,139 +189,65 @@ class TestIBKRAPIClient:
                 "currency": "USD",
             }
         ]
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/portfolio/U1234567/positions",
-                json=expected_response,
-                status_code=200,
-            )
-            result = client.get_positions("U1234567")
-            assert result == expected_response
-
-    def test_get_positions_404_raises_client_error(self):
+        requests_mock.get(
+            f"{BASE_URL}/portfolio/U1234567/positions",
+            json=expected_response,
+            status_code=200,
+        )
+        result = client.get_positions("U1234567")
+        assert result == expected_response
+
+    def test_get_positions_404_raises_client_error(self, client, requests_mock):
         """Test get_positions with 404 raises ClientError (non-retryable)."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/portfolio/INVALID/positions",
-                status_code=404,
-            )
-            with pytest.raises(ClientError, match="Endpoint not found"):
-                client.get_positions("INVALID")
-
-    def test_retry_on_500_error(self):
+        requests_mock.get(
+            f"{BASE_URL}/portfolio/INVALID/positions",
+            status_code=404,
+        )
+        with pytest.raises(ClientError, match="Endpoint not found"):
+            client.get_positions("INVALID")
+
+    def test_retry_on_500_error(self, client, gateway):
         """Test that 500 errors are retried."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            # First two attempts fail with 500, third succeeds
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                [
-                    {"status_code": 500},
-                    {"status_code": 500},
-                    {"json": {"status": "ok"}, "status_code": 200},
-                ],
-            )
-            # Should eventually succeed after retries
-            result = client.tickle()
-            assert result == {"status": "ok"}
-            assert len(m.request_history) == 3
-
-    def test_no_retry_on_401_error(self):
-        """Test that 401 errors are not retried."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                status_code=401,
-            )
-            with pytest.raises(AuthenticationError):
-                client.tickle()
-            # Should only make one request (no retry)
-            assert len(m.request_history) == 1
-
-    def test_429_rate_limiting_raises_api_error_retryable(self):
+        # First two attempts fail with 500, third succeeds
+        adapter = gateway(
+            {"status_code": 500},
+            {"status_code": 500},
+            OK_RESPONSE,
+        )
+        # Should eventually succeed after retries
+        result = client.tickle()
+        assert result == {"status": "ok"}
+        assert len(adapter.requests) == 3
+
+    def test_429_rate_limiting_raises_api_error_retryable(self, client, gateway):
         """Test that 429 rate limiting raises retryable APIError."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            # First attempt gets 429, second succeeds
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                [
-                    {"status_code": 429},
-                    {"json": {"status": "ok"}, "status_code": 200},
-                ],
-            )
-            # Should eventually succeed after retry
-            result = client.tickle()
-            assert result == {"status": "ok"}
-            assert len(m.request_history) == 2
-
-    def test_429_rate_limiting_retries_with_backoff(self):
+        # First attempt gets 429, second succeeds
+        adapter = gateway(
+            {"status_code": 429},
+            OK_RESPONSE,
+        )
+        # Should eventually succeed after retry
+        result = client.tickle()
+        assert result == {"status": "ok"}
+        assert len(adapter.requests) == 2
+
+    def test_429_rate_limiting_retries_with_backoff(self, client, gateway):
         """Test that 429 errors are retried with exponential backoff."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            # First two attempts get 429, third succeeds
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                [
-                    {"status_code": 429},
-                    {"status_code": 429},
-                    {"json": {"status": "ok"}, "status_code": 200},
-                ],
-            )
-            result = client.tickle()
-            assert result == {"status": "ok"}
-            assert len(m.request_history) == 3
-
-    def test_ssl_error_raises_network_error(self):
+        # First two attempts get 429, third succeeds
+        adapter = gateway(
+            {"status_code": 429},
+            {"status_code": 429},
+            OK_RESPONSE,
+        )
+        result = client.tickle()
+        assert result == {"status": "ok"}
+        assert len(adapter.requests) == 3
+
+    def test_ssl_error_raises_network_error(self, client, requests_mock):
         """Test that SSLError raises NetworkError."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                exc=requests.exceptions.SSLError("SSL certificate verification failed"),
-            )
-            with pytest.raises(NetworkError, match="SSL error"):
-                client.tickle()
-
-    def test_retry_exhaustion_after_5_attempts(self):
-        """Test that retries stop after 5 attempts."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            # All 5 attempts fail with 500
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                status_code=500,
-            )
-            with pytest.raises(APIError, match="Server error"):
-                client.tickle()
-            # Should have made exactly 5 attempts
-            assert len(m.request_history) == 5
-
-    def test_other_4xx_errors_raise_client_error_no_retry(self):
-        """Test that other 4xx errors (400, 402, etc.) raise ClientError without retry."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                status_code=400,
-                text="Bad Request: Invalid parameters",
-            )
-            with pytest.raises(ClientError, match="Client error 400"):
-                client.tickle()
-            # Should only make one request (no retry for ClientError)
-            assert len(m.request_history) == 1
-
-    def test_402_payment_required_no_retry(self):
-        """Test that 402 Payment Required raises ClientError and doesn't retry."""
-        client = IBKRAPIClient()
-        with requests_mock.Mocker() as m:
-            m.get(
-                "https://localhost:5001/v1/api/tickle",
-                status_code=402,
-                text="Payment Required",
-            )
-            with pytest.raises(ClientError, match="Client error 402"):
-                client.tickle()
-            assert len(m.request_history) == 1
+        requests_mock.get(
+            f"{BASE_URL}/tickle",
+            exc=requests.exceptions.SSLError("SSL certificate verification failed"),
+        )
+        with pytest.raises(NetworkError, match="SSL error"):
+            client.tickle()
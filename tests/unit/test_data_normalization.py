@@ -1,55 +1,123 @@
 """Unit tests for data normalization."""
 
-from datetime import datetime
+import re
 from decimal import Decimal
+from types import MappingProxyType
+
+import pytest
 
 from src.data_normalization import currency_to_int, normalize_positions
 
+# UTC ISO-8601 timestamp with a Z suffix, as normalize_positions generates it
+_ISO8601_Z = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z$")
+
+# Read-only API payloads shared by the normalize_positions tests; built once
+_AAPL = MappingProxyType(
+    {
+        "conid": 265598,
+        "symbol": "AAPL",
+        "secType": "STK",
+        "position": 100,
+        "currency": "USD",
+    }
+)
+_POS_AAPL = (_AAPL,)
+_POS_BASIC = (
+    MappingProxyType(
+        {**_AAPL, "marketPrice": 150.25, "marketValue": 15025.00, "avgCost": 140.00}
+    ),
+)
+_POS_WITH_OPTIONAL = (
+    MappingProxyType(
+        {
+            **_AAPL,
+            "name": "Apple Inc.",
+            "exchange": "NASDAQ",
+            "primaryExchange": "NASDAQ",
+            "localSymbol": "AAPL",
+        }
+    ),
+)
+_POS_WITH_PNL = (
+    MappingProxyType({**_AAPL, "unrealizedPnl": 1025.50, "realizedPnl": 500.25}),
+)
+_POS_OPT = (
+    MappingProxyType(
+        {
+            "conid": 5000000,
+            "symbol": "AAPL",
+            "secType": "OPT",
+            "position": 10,
+            "currency": "USD",
+            "expiry": "2025-03-21",
+            "strike": 150.0,
+            "right": "C",
+            "underlyingConid": 265598,
+        }
+    ),
+)
+_POS_FUT = (
+    MappingProxyType(
+        {
+            "conid": 6000000,
+            "symbol": "ES",
+            "secType": "FUT",
+            "position": 2,
+            "currency": "USD",
+            "multiplier": 50.0,
+            "expiry": "2025-03-21",
+        }
+    ),
+)
+_POS_MULTI = (
+    _AAPL,
+    MappingProxyType({**_AAPL, "conid": 272093, "symbol": "MSFT", "position": 50}),
+)
+_POS_MISSING_CONID = (
+    MappingProxyType({k: v for k, v in _AAPL.items() if k != "conid"}),
+    _AAPL,
+)
+
 
 class TestCurrencyToInt:
     """Test currency conversion to integer."""
 
-    def test_usd_conversion(self):
-        """Test USD conversion to micro-dollars."""
-        amount = Decimal("150.25")
-        result = currency_to_int(amount, "USD")
-        assert result == 150250000  # 150.25 * 1,000,000
-
-    def test_usd_with_decimals(self):
-        """Test USD conversion with 6 decimal places."""
-        amount = Decimal("150.251234")
-        result = currency_to_int(amount, "USD")
-        assert result == 150251234  # Preserves 6 decimal places
-
-    def test_eur_conversion(self):
-        """Test EUR conversion uses micro-dollars precision."""
-        amount = Decimal("100.50")
-        result = currency_to_int(amount, "EUR")
-        assert result == 100500000
-
-    def test_jpy_conversion(self):
-        """Test JPY conversion uses 3 decimal places."""
-        amount = Decimal("15000.50")
-        result = currency_to_int(amount, "JPY")
-        assert result == 15000500  # 15000.50 * 1,000
-
-    def test_unknown_currency_defaults_to_micro_dollars(self):
-        """Test unknown currency defaults to micro-dollars."""
-        amount = Decimal("100.00")
-        result = currency_to_int(amount, "XYZ")
-        assert result == 100000000
-
-    def test_zero_amount(self):
-        """Test zero amount conversion."""
-        amount = Decimal("0")
-        result = currency_to_int(amount, "USD")
-        assert result == 0
-
-    def test_negative_amount(self):
-        """Test negative amount conversion."""
-        amount = Decimal("-100.50")
-        result = currency_to_int(amount, "USD")
-        assert result == -100500000
+    @pytest.mark.parametrize(
+        "amount, currency, expected",
+        [
+            # 150.25 * 1,000,000
+            pytest.param(Decimal("150.25"), "USD", 150250000, id="usd"),
+            # Preserves 6 decimal places
+            pytest.param(Decimal("150.251234"), "USD", 150251234, id="usd_decimals"),
+            # EUR uses micro-dollars precision
+            pytest.param(Decimal("100.50"), "EUR", 100500000, id="eur"),
+            # JPY uses 3 decimal places: 15000.50 * 1,000
+            pytest.param(Decimal("15000.50"), "JPY", 15000500, id="jpy"),
+            # Unknown currency defaults to micro-dollars
+            pytest.param(Decimal("100.00"), "XYZ", 100000000, id="unknown"),
+            pytest.param(Decimal("0"), "USD", 0, id="zero"),
+            pytest.param(Decimal("-100.50"), "USD", -100500000, id="negative"),
+        ],
+    )
+    def test_currency_to_int(self, amount, currency, expected):
+        """Test conversion to the currency's integer precision."""
+        assert currency_to_int(amount, currency) == expected
+
+    @pytest.mark.parametrize(
+        "currency, scale",
+        [
+            ("USD", 10**6),
+            ("EUR", 10**6),
+            ("GBP", 10**6),
+            ("CAD", 10**6),
+            ("AUD", 10**6),
+            ("JPY", 10**3),
+            ("XYZ", 10**6),
+        ],
+    )
+    def test_currency_scale_lookup(self, currency, scale):
+        """Test that one unit converts to the currency's fixed-point scale."""
+        assert currency_to_int(Decimal("1"), currency) == scale
 
 
 class TestNormalizePositions:
@@ -57,68 +125,34 @@ class TestNormalizePositions:
 
     def test_normalize_basic_position(self):
         """Test normalization of basic position."""
-        api_response = [
-            {
-                "conid": 265598,
-                "symbol": "AAPL",
-                "secType": "STK",
-                "position": 100,
-                "marketPrice": 150.25,
-                "marketValue": 15025.00,
-                "avgCost": 140.00,
-                "currency": "USD",
-            }
-        ]
-
-        result = normalize_positions(api_response, "U1234567")
-
+        result = normalize_positions(_POS_BASIC, "U1234567")
+
+        expected = {
+            "account_id": "U1234567",
+            "conid": 265598,
+            "symbol": "AAPL",
+            "sec_type": "STK",
+            "quantity": 100.0,
+            "currency": "USD",
+            "market_price": 150250000,  # micro-dollars
+            "market_value": 15025000000,  # micro-dollars
+            "avg_cost": 140000000,  # micro-dollars
+        }
         assert len(result) == 1
         pos = result[0]
-        assert pos["account_id"] == "U1234567"
-        assert pos["conid"] == 265598
-        assert pos["symbol"] == "AAPL"
-        assert pos["sec_type"] == "STK"
-        assert pos["quantity"] == 100.0
-        assert pos["currency"] == "USD"
-        assert pos["market_price"] == 150250000  # micro-dollars
-        assert pos["market_value"] == 15025000000  # micro-dollars
-        assert pos["avg_cost"] == 140000000  # micro-dollars
+        assert {k: pos[k] for k in expected} == expected
         assert "snapshot_ts" in pos
 
     def test_normalize_position_with_custom_snapshot_ts(self):
         """Test normalization with custom snapshot timestamp."""
-        api_response = [
-            {
-                "conid": 265598,
-                "symbol": "AAPL",
-                "secType": "STK",
-                "position": 100,
-                "currency": "USD",
-            }
-        ]
-
         snapshot_ts = "2025-01-15T10:30:00Z"
-        result = normalize_positions(api_response, "U1234567", snapshot_ts)
+        result = normalize_positions(_POS_AAPL, "U1234567", snapshot_ts)
 
         assert result[0]["snapshot_ts"] == snapshot_ts
 
     def test_normalize_position_with_optional_fields(self):
         """Test normalization with optional symbol fields."""
-        api_response = [
-            {
-                "conid": 265598,
-                "symbol": "AAPL",
-                "secType": "STK",
-                "position": 100,
-                "currency": "USD",
-                "name": "Apple Inc.",
-                "exchange": "NASDAQ",
-                "primaryExchange": "NASDAQ",
-                "localSymbol": "AAPL",
-            }
-        ]
-
-        result = normalize_positions(api_response, "U1234567")
+        result = normalize_positions(_POS_WITH_OPTIONAL, "U1234567")
 
         assert result[0]["symbol_name"] == "Apple Inc."
         assert result[0]["exchange"] == "NASDAQ"
@@ -127,40 +161,14 @@ class TestNormalizePositions:
 
     def test_normalize_position_with_pnl(self):
         """Test normalization with unrealized and realized P&L."""
-        api_response = [
-            {
-                "conid": 265598,
-                "symbol": "AAPL",
-                "secType": "STK",
-                "position": 100,
-                "currency": "USD",
-                "unrealizedPnl": 1025.50,
-                "realizedPnl": 500.25,
-            }
-        ]
-
-        result = normalize_positions(api_response, "U1234567")
+        result = normalize_positions(_POS_WITH_PNL, "U1234567")
 
         assert result[0]["unrealized_pnl"] == 1025500000  # micro-dollars
         assert result[0]["realized_pnl"] == 500250000  # micro-dollars
 
     def test_normalize_option_position(self):
         """Test normalization of option position."""
-        api_response = [
-            {
-                "conid": 5000000,
-                "symbol": "AAPL",
-                "secType": "OPT",
-                "position": 10,
-                "currency": "USD",
-                "expiry": "2025-03-21",
-                "strike": 150.0,
-                "right": "C",
-                "underlyingConid": 265598,
-            }
-        ]
-
-        result = normalize_positions(api_response, "U1234567")
+        result = normalize_positions(_POS_OPT, "U1234567")
 
         assert result[0]["sec_type"] == "OPT"
         assert result[0]["expiry"] == "2025-03-21"
@@ -170,19 +178,7 @@ class TestNormalizePositions:
 
     def test_normalize_future_position(self):
         """Test normalization of future position."""
-        api_response = [
-            {
-                "conid": 6000000,
-                "symbol": "ES",
-                "secType": "FUT",
-                "position": 2,
-                "currency": "USD",
-                "multiplier": 50.0,
-                "expiry": "2025-03-21",
-            }
-        ]
-
-        result = normalize_positions(api_response, "U1234567")
+        result = normalize_positions(_POS_FUT, "U1234567")
 
         assert result[0]["sec_type"] == "FUT"
         assert result[0]["multiplier"] == 50.0
@@ -190,49 +186,16 @@ class TestNormalizePositions:
 
     def test_normalize_multiple_positions(self):
         """Test normalization of multiple positions."""
-        api_response = [
-            {
-                "conid": 265598,
-                "symbol": "AAPL",
-                "secType": "STK",
-                "position": 100,
-                "currency": "USD",
-            },
-            {
-                "conid": 272093,
-                "symbol": "MSFT",
-                "secType": "STK",
-                "position": 50,
-                "currency": "USD",
-            },
-        ]
-
-        result = normalize_positions(api_response, "U1234567")
+        result = normalize_positions(_POS_MULTI, "U1234567")
 
-        assert len(result) == 2
-        assert result[0]["symbol"] == "AAPL"
-        assert result[1]["symbol"] == "MSFT"
+        assert [(p["conid"], p["symbol"], p["sec_type"]) for p in result] == [
+            (265598, "AAPL", "STK"),
+            (272093, "MSFT", "STK"),
+        ]
 
     def test_normalize_skips_position_without_conid(self):
         """Test that positions without conid are skipped."""
-        api_response = [
-            {
-                "symbol": "AAPL",
-                "secType": "STK",
-                "position": 100,
-                "currency": "USD",
-                # Missing conid
-            },
-            {
-                "conid": 265598,
-                "symbol": "AAPL",
-                "secType": "STK",
-                "position": 100,
-                "currency": "USD",
-            },
-        ]
-
-        result = normalize_positions(api_response, "U1234567")
+        result = normalize_positions(_POS_MISSING_CONID, "U1234567")
 
         # Should only include position with conid
         assert len(result) == 1
@@ -240,18 +203,8 @@ class TestNormalizePositions:
 
     def test_normalize_handles_null_prices(self):
         """Test normalization handles null price fields."""
-        api_response = [
-            {
-                "conid": 265598,
-                "symbol": "AAPL",
-                "secType": "STK",
-                "position": 100,
-                "currency": "USD",
-                # marketPrice, marketValue, avgCost are None/missing
-            }
-        ]
-
-        result = normalize_positions(api_response, "U1234567")
+        # marketPrice, marketValue, avgCost are missing from _POS_AAPL
+        result = normalize_positions(_POS_AAPL, "U1234567")
 
         assert "market_price" not in result[0]
         assert "market_value" not in result[0]
@@ -264,22 +217,9 @@ class TestNormalizePositions:
 
     def test_normalize_auto_generates_snapshot_ts(self):
         """Test that snapshot_ts is auto-generated if not provided."""
-        api_response = [
-            {
-                "conid": 265598,
-                "symbol": "AAPL",
-                "secType": "STK",
-                "position": 100,
-                "currency": "USD",
-            }
-        ]
-
-        result = normalize_positions(api_response, "U1234567")
+        result = normalize_positions(_POS_AAPL, "U1234567")
 
         # Should have snapshot_ts
         assert "snapshot_ts" in result[0]
         # Should be valid ISO-8601 with Z suffix
-        assert result[0]["snapshot_ts"].endswith("Z")
-        # Should be parseable
-        parsed = datetime.fromisoformat(result[0]["snapshot_ts"].replace("Z", "+00:00"))
-        assert parsed is not None
+        assert _ISO8601_Z.match(result[0]["snapshot_ts"])